@@ -24,6 +24,31 @@
 import os
 import magic
 
+SNIFF_SIZE = 8192
+EXTENSIONS = {".jpeg": "image/jpeg",
+              ".jpg": "image/jpeg",
+              ".png": "image/png",
+              ".bmp": "image/bmp",
+              ".gif": "image/gif",
+              ".svg": "image/svg+xml",
+              ".pdf": "application/pdf",
+              ".txt": "text/plain"}
+
+
+def file_type(file_path):
+    '''
+    FUNCIÓN QUE DEVUELVE EL TIPO MIME DE UN FICHERO
+    '''
+    if os.path.isdir(file_path):
+        return "inode/directory"
+    # PRIMERO LA TABLA DE EXTENSIONES, SIN TOCAR EL DISCO
+    mime = EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    if mime:
+        return mime
+    # SI NO, LIBMAGIC SOLO CON LOS PRIMEROS KIB DEL FICHERO
+    with open(file_path, "rb") as file_pipe:
+        return magic.from_buffer(file_pipe.read(SNIFF_SIZE), mime=True)
+
 
 def list_dir(user_path, filetype):
     '''
@@ -32,5 +57,5 @@ def list_dir(user_path, filetype):
     if os.path.isdir(user_path):
         for file in os.listdir(user_path):
             absolute_path_file = os.path.join(user_path, file)
-            if filetype == magic.from_file(absolute_path_file, mime=True):
+            if filetype == file_type(absolute_path_file):
                 print(f"{file}")
@@ -26,6 +26,31 @@ import os
 import magic
 import app_globals
 
+SNIFF_SIZE = 8192
+EXTENSIONS = {".jpeg": "image/jpeg",
+              ".jpg": "image/jpeg",
+              ".png": "image/png",
+              ".bmp": "image/bmp",
+              ".gif": "image/gif",
+              ".svg": "image/svg+xml",
+              ".pdf": "application/pdf",
+              ".txt": "text/plain"}
+
+
+def file_type(file_path):
+    '''
+    FUNCIÓN QUE DEVUELVE EL TIPO MIME DE UN FICHERO
+    '''
+    if os.path.isdir(file_path):
+        return "inode/directory"
+    # PRIMERO LA TABLA DE EXTENSIONES, SIN TOCAR EL DISCO
+    mime = EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+    if mime:
+        return mime
+    # SI NO, LIBMAGIC SOLO CON LOS PRIMEROS KIB DEL FICHERO
+    with open(file_path, "rb") as file_pipe:
+        return magic.from_buffer(file_pipe.read(SNIFF_SIZE), mime=True)
+
 
 def list_dir(toml_cfg_dict, filetype):
     '''
@@ -51,5 +76,5 @@ def list_dir(toml_cfg_dict, filetype):
             for dir_entry_item in os.listdir(dir_entry):
                 apf = os.path.join(dir_entry, dir_entry_item)
                 if not os.path.isdir(apf):
-                    if filetype == magic.from_file(apf, mime=True):
+                    if filetype == file_type(apf):
                         print(f"{dir_entry_item}")
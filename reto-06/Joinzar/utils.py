@@ -52,6 +52,7 @@
 # bien se dejan para una fase posterior, quizás haciéndolo multilingüe      #
 #############################################################################
 
+import errno
 import os
 import mimetypes
 import shutil
@@ -132,20 +133,24 @@ def move_files(directory_in, directory_out):
     Según instrucciones, se deben mover los archivos de in a out,
     pero si existen en destino, se deben borrar antes. ¿Cuáles?
     Entiendo que para cada archivo.
+    En el mismo dispositivo, os.replace sobrescribe el destino de forma
+    atómica, sin borrarlo antes y sin que el archivo deje de existir en
+    ningún momento. Entre dispositivos distintos se recurre a shutil.move.
     Meto un mensaje de confirmación (verbose)
 
     """
     if os.path.exists(directory_in):
         if not os.path.exists(directory_out):
             os.makedirs(directory_out)
-        ficheros_in = os.listdir(directory_in)
-        ficheros_out = os.listdir(directory_out)
-        for afile in ficheros_in:
-            if afile not in ficheros_out:
-                shutil.move(directory_in + '/' + afile, directory_out)
-            else:
-                os.remove(directory_out + '/' + afile)
-                shutil.move(directory_in + '/' + afile, directory_out)
+        for afile in os.listdir(directory_in):
+            origen = directory_in + '/' + afile
+            destino = directory_out + '/' + afile
+            try:
+                os.replace(origen, destino)
+            except OSError as error:
+                if error.errno != errno.EXDEV:
+                    raise
+                shutil.move(origen, destino)
     else:
         # print(f"{directory_in} no existe. Nada para copiar")
         pass
@@ -22,10 +22,14 @@
 # SOFTWARE.
 
 import os
-import shutil
 from pathlib import Path
 import toml
 from pprint import pprint
+from index import FileIndex
+from planner import plan
+from watcher import Watcher
+
+INDEX = "diogenes.db"
 
 
 class Configurator:
@@ -63,27 +67,82 @@ class Configurator:
         with open(config_file, 'w') as file_writer:
             toml.dump(conf, file_writer)
 
-    def do_action(self):
-        conf = self.read()
-        pprint(conf)
+    def entries(self, conf):
         for data in conf['directorios'].values():
             if 'in' in data and 'out' in data and 'actions' in data \
                     and 'filter' in data:
-                dir_in = Path(data['in'])
-                dir_ou = Path(data['out'])
-                actions = data['actions']
-                filter = data['filter']
-                print("===========")
-                print(actions)
-                print(filter)
-                for item in dir_in.glob(filter):
-                    if item.is_file():
-                        print(f"archivo: {item}")
-                        for action in actions:
-                            dest = dir_ou / item.name
-                            if action == 'move':
-                                print(f"move {dest}")
-                                shutil.move(item, dest)
-                            elif action == 'copy':
-                                print(f"copy {dest}")
-                                shutil.copy(item, dest)
+                # Si cambia la entrada de configuración, cambia el scope y se
+                # vuelve a procesar todo el directorio.
+                scope = repr((data['in'], data['out'], data['actions'],
+                              data['filter']))
+                yield scope, data
+
+    def execute(self, operations, dry_run=False):
+        for operation in operations:
+            print(operation)
+            if not dry_run:
+                operation.execute()
+
+    def do_action(self, dry_run=False):
+        conf = self.read()
+        pprint(conf)
+        index = FileIndex(self.path / INDEX, dry_run)
+        scopes = []
+        for group in plan(self.entries(conf)):
+            print("===========")
+            print(group.directory)
+            for _, data in group.rules:
+                print(data['actions'], data['filter'], data['out'])
+            scopes.append(group.scope)
+            with index:
+                # Lo que se ha borrado de 'out' se vuelve a procesar.
+                for scope, data in group.rules:
+                    scopes.append(scope)
+                    _, removed = index.sync(scope, Path(data['out']),
+                                            data['filter'])
+                    index.forget(group.scope, group.directory, removed)
+                # Un único recorrido del directorio para todas las reglas.
+                changed, _ = index.sync(group.scope, group.directory)
+                # Primero el plan completo y después se ejecuta.
+                operations = []
+                for item in changed:
+                    operations += group.plan(item.path)
+                self.execute(operations, dry_run)
+                if dry_run:
+                    index.rollback()
+        with index:
+            index.prune(scopes)
+        index.close()
+
+    def watch(self):
+        # Modo demonio: se suscribe con inotify a cada directorio 'in' y
+        # solo ejecuta las acciones de los archivos afectados.
+        conf = self.read()
+        groups = {}
+        watcher = Watcher()
+        for group in plan(self.entries(conf)):
+            groups[group.directory] = group
+            watcher.add(group.directory)
+        # Lo que haya llegado mientras no se vigilaba.
+        self.do_action()
+        index = FileIndex(self.path / INDEX)
+        try:
+            while True:
+                changes, overflow = watcher.read()
+                if overflow:
+                    # Se han perdido eventos: el índice hace que el nuevo
+                    # escaneo solo actúe sobre lo que realmente ha cambiado.
+                    print("inotify: cola desbordada, escaneando de nuevo")
+                    self.do_action()
+                    continue
+                for directory, names in changes.items():
+                    group = groups[directory]
+                    names = [name for name in names if group.route(name)]
+                    with index:
+                        changed, _ = index.update(group.scope, directory,
+                                                  names)
+                        for source in changed:
+                            self.execute(group.plan(source))
+        finally:
+            index.close()
+            watcher.close()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from pathlib import Path
+import stat
+import sqlite3
+from scanner import scan
+
+
+class FileIndex:
+    # Guarda, por cada entrada de 'directorios' (scope) y directorio, la
+    # identidad de cada archivo: (st_dev, st_ino, size, mtime_ns). Así cada
+    # ejecución solo procesa lo nuevo o modificado desde la anterior.
+    def __init__(self, database, dry_run=False):
+        if dry_run:
+            # En modo dry-run se trabaja sobre una copia en memoria del
+            # índice, abierto solo para lectura: nada llega al disco.
+            self.__connection = sqlite3.connect(":memory:")
+            if os.path.exists(database):
+                uri = Path(database).absolute().as_uri() + "?mode=ro"
+                source = sqlite3.connect(uri, uri=True)
+                source.backup(self.__connection)
+                source.close()
+        else:
+            self.__connection = sqlite3.connect(database)
+        self.__connection.execute("""
+            CREATE TABLE IF NOT EXISTS files (
+                scope TEXT NOT NULL,
+                directory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                PRIMARY KEY (scope, directory, name))""")
+        self.__connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Si las acciones fallan no se confirma nada, de forma que en la
+        # siguiente ejecución esos archivos vuelven a aparecer como nuevos.
+        if exc_type is None:
+            self.__connection.commit()
+        else:
+            self.__connection.rollback()
+        return False
+
+    def rollback(self):
+        self.__connection.rollback()
+
+    def close(self):
+        self.__connection.close()
+
+    def prune(self, scopes):
+        scopes = list(scopes)
+        marks = ", ".join("?" for _ in scopes)
+        self.__connection.execute(
+            f"DELETE FROM files WHERE scope NOT IN ({marks})", scopes)
+
+    def forget(self, scope, directory, names):
+        self.__connection.executemany(
+            "DELETE FROM files WHERE scope = ? AND directory = ? AND name = ?",
+            [(scope, str(directory), name) for name in names])
+
+    def update(self, scope, directory, names):
+        # Igual que sync pero solo para los nombres indicados, sin recorrer
+        # el directorio. Devuelve rutas en lugar de DirEntry.
+        directory = str(directory)
+        changed = []
+        removed = set()
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                info = os.stat(path)
+            except FileNotFoundError:
+                removed.add(name)
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+            key = (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns)
+            row = self.__connection.execute(
+                "SELECT dev, ino, size, mtime_ns FROM files "
+                "WHERE scope = ? AND directory = ? AND name = ?",
+                (scope, directory, name)).fetchone()
+            if row != key:
+                changed.append(path)
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO files "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (scope, directory, name) + key)
+        self.forget(scope, directory, removed)
+        return changed, removed
+
+    def sync(self, scope, directory, pattern=None):
+        # Recorre el directorio una sola vez y devuelve las entradas nuevas o
+        # modificadas y los nombres que han desaparecido desde la última vez.
+        directory = str(directory)
+        cursor = self.__connection.execute(
+            "SELECT name, dev, ino, size, mtime_ns FROM files "
+            "WHERE scope = ? AND directory = ?", (scope, directory))
+        known = {row[0]: tuple(row[1:]) for row in cursor}
+        changed = []
+        rows = []
+        for entry in scan(directory, pattern):
+            stat = entry.stat()
+            key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if known.pop(entry.name, None) != key:
+                changed.append(entry)
+                rows.append((scope, directory, entry.name) + key)
+        self.__connection.executemany(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        removed = set(known)
+        self.forget(scope, directory, removed)
+        return changed, removed
@@ -21,6 +21,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
 from pathlib import Path
 from xdg import xdg_config_home
 from configurator import Configurator
@@ -41,20 +42,29 @@ def step2(path, config):
             print(image.name)
 
 
-def step3(path, config):
+def step3(path, config, dry_run=False):
     print("=== step 3 ===")
     conf = Configurator(path, config)
-    conf.do_action()
+    conf.do_action(dry_run)
 
 
-def main(app, config):
+def step4(path, config):
+    print("=== step 4 (watch) ===")
+    conf = Configurator(path, config)
+    conf.watch()
+
+
+def main(app, config, watch=False, dry_run=False):
     path = Path(xdg_config_home()) / app
     step1(path, config)
     step2(path, config)
-    step3(path, config)
+    step3(path, config, dry_run)
+    if watch and not dry_run:
+        step4(path, config)
 
 
 if __name__ == '__main__':
     APP = "diogenes"
     config = f"{APP}.conf"
-    main(APP, config)
+    main(APP, config, watch="--watch" in sys.argv[1:],
+         dry_run="--dry-run" in sys.argv[1:])
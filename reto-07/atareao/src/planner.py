@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import fnmatch
+import shutil
+
+
+class Group:
+    # Todas las entradas de 'directorios' que comparten el mismo directorio
+    # 'in' (ya resuelto), en el orden en que aparecen en la configuración.
+    # Así el directorio se recorre una sola vez para todas ellas.
+    def __init__(self, directory):
+        self.directory = directory
+        self.rules = []
+        self.outs = []
+        self.by_suffix = {}
+        self.others = []
+
+    @property
+    def scope(self):
+        return repr([scope for scope, _ in self.rules])
+
+    def add(self, scope, data):
+        order = len(self.rules)
+        self.rules.append((scope, data))
+        self.outs.append(os.path.realpath(data['out']))
+        filter = data['filter']
+        suffix = filter[1:]
+        # Los filtros '*.ext' van a un índice por extensión; el resto se
+        # comprueba con fnmatch.
+        if filter.startswith('*.') and suffix.count('.') == 1 and \
+                not any(c in suffix for c in '*?['):
+            self.by_suffix.setdefault(suffix, []).append(order)
+        else:
+            self.others.append((order, filter))
+
+    def orders(self, name):
+        # Las reglas que cumple el archivo, siempre en el orden de la
+        # configuración.
+        dot = name.rfind('.')
+        orders = list(self.by_suffix.get(name[dot:], ())) if dot >= 0 else []
+        orders += [order for order, filter in self.others
+                   if fnmatch.fnmatchcase(name, filter)]
+        return sorted(orders)
+
+    def route(self, name):
+        return [self.rules[order] for order in self.orders(name)]
+
+    def plan(self, source):
+        # Las operaciones que hay que hacer con un archivo, ya fusionadas,
+        # sin tocar el disco.
+        name = os.path.basename(source)
+        operations = []
+        for order in self.orders(name):
+            _, data = self.rules[order]
+            actions = fuse(data['actions'])
+            # Copiar o mover un archivo sobre sí mismo no cambia nada.
+            if self.outs[order] == self.directory:
+                continue
+            dest = os.path.join(data['out'], name)
+            operations += [Operation(action, source, dest)
+                           for action in actions]
+            # Si se ha movido, las reglas siguientes ya no lo verán.
+            if 'move' in actions:
+                break
+        return operations
+
+
+class Operation:
+    def __init__(self, action, source, dest):
+        self.action = action
+        self.source = source
+        self.dest = dest
+
+    def __str__(self):
+        return f"{self.action} {self.source} -> {self.dest}"
+
+    def execute(self):
+        if self.action == 'move':
+            shutil.move(self.source, self.dest)
+        elif self.action == 'copy':
+            shutil.copy(self.source, self.dest)
+
+
+def fuse(actions):
+    # Reduce la lista de acciones de una entrada a lo que realmente cambia
+    # en el disco: 'none' desaparece, copiar y después mover al mismo
+    # destino es solo mover, y tras un 'move' ya no queda origen.
+    fused = []
+    for action in actions:
+        if action not in ('copy', 'move') or 'move' in fused:
+            continue
+        if action == 'copy' and 'copy' in fused:
+            continue
+        if action == 'move' and fused:
+            fused[-1] = 'move'
+        else:
+            fused.append(action)
+    return fused
+
+
+def plan(entries):
+    groups = {}
+    for scope, data in entries:
+        directory = os.path.realpath(data['in'])
+        if directory not in groups:
+            groups[directory] = Group(directory)
+        groups[directory].add(scope, data)
+    return list(groups.values())
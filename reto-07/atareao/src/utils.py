@@ -23,15 +23,14 @@
 
 import os
 import mimetypes
+from scanner import scan
 
 mimetypes.init()
 
 
 def list_images(directory):
-    images = []
     if not directory.exists():
         os.makedirs(directory)
-    for afile in directory.iterdir():
-        if not afile.is_dir() and mimetypes.guess_type(afile)[0] == 'image/jpeg':
-            images.append(afile)
-    return images
+    for entry in scan(directory):
+        if mimetypes.guess_type(entry.name)[0] == 'image/jpeg':
+            yield entry
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+# Solo interesan los archivos que terminan de escribirse o que llegan a
+# un directorio vigilado (las descargas suelen renombrarse al acabar).
+MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+EVENT = struct.Struct("iIII")
+BUFFER_SIZE = 64 * 1024
+
+
+class Watcher:
+    def __init__(self):
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c"),
+                                  use_errno=True)
+        self.__fd = self.__libc.inotify_init1(IN_CLOEXEC | IN_NONBLOCK)
+        if self.__fd < 0:
+            self.__raise()
+        self.__watches = {}
+
+    def __raise(self):
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+
+    def add(self, directory):
+        directory = os.path.abspath(directory)
+        wd = self.__libc.inotify_add_watch(self.__fd,
+                                           os.fsencode(directory), MASK)
+        if wd < 0:
+            self.__raise()
+        self.__watches[wd] = directory
+
+    def close(self):
+        os.close(self.__fd)
+
+    def read(self, timeout=None):
+        # Espera a que haya eventos y los agrupa por directorio. Devuelve
+        # {directorio: {nombres}} y si el kernel ha desbordado la cola, en
+        # cuyo caso hay eventos perdidos y toca volver a escanear.
+        changes = {}
+        overflow = False
+        ready, _, _ = select.select([self.__fd], [], [], timeout)
+        while ready:
+            try:
+                buffer = os.read(self.__fd, BUFFER_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = EVENT.unpack_from(buffer, offset)
+                offset += EVENT.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                elif mask & IN_IGNORED:
+                    self.__watches.pop(wd, None)
+                elif not mask & IN_ISDIR and wd in self.__watches:
+                    directory = self.__watches[wd]
+                    changes.setdefault(directory, set()).add(
+                        os.fsdecode(name))
+            ready, _, _ = select.select([self.__fd], [], [], 0)
+        return changes, overflow
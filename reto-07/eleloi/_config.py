@@ -17,6 +17,12 @@ class Action(Enum):
     COPY = "copy"
 
 
+class Dedupe(Enum):
+    NONE = "none"
+    SKIP = "skip"
+    HARDLINK = "hardlink"
+
+
 class UserDir(pydantic.BaseModel):
     in_: str = pydantic.Field(alias="in")
     out: str
@@ -26,6 +32,7 @@ class UserDir(pydantic.BaseModel):
         # description="a filter to select which files to process, like *.jpg",
         alias="filter",
     )
+    dedupe: Dedupe = Dedupe.NONE
 
     @pydantic.validator("filter_")
     @classmethod
@@ -37,6 +44,8 @@ class UserDir(pydantic.BaseModel):
 
 class Configuration(pydantic.BaseModel):
     directorios: list[UserDir]
+    max_workers: int = 8
+    max_per_device: int = 4
 
 
 def _generate_default_configuration_file(config_path: str) -> None:
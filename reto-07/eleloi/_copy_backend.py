@@ -0,0 +1,99 @@
+import errno
+import fcntl
+import os
+import shutil
+from typing import Callable, Optional
+
+# ioctl request number of FICLONE (_IOW(0x94, 9, int)) on Linux
+FICLONE = 0x40049409
+
+_CHUNK = 1 << 30
+_BUFFER = 1 << 20
+
+# errors meaning "this strategy can't be used here", not "the copy failed"
+_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ETXTBSY,
+}
+
+Strategy = Callable[[int, int, int], None]
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int) -> None:
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _stalled(copied: int, size: int) -> None:
+    """
+    A kernel copy returned 0 before size bytes: some filesystems and pseudo
+    files do that instead of failing. With nothing written yet the next
+    strategy can take over, otherwise dst is truncated and that's an error
+    """
+    if copied == 0:
+        raise OSError(errno.EINVAL, "kernel copy made no progress")
+    raise OSError(errno.EIO, f"short copy: {copied} of {size} bytes")
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, size: int) -> None:
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(src_fd, dst_fd, min(size - copied, _CHUNK))
+        if count == 0:
+            _stalled(copied, size)
+        copied += count
+
+
+def _sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    copied = 0
+    while copied < size:
+        count = os.sendfile(dst_fd, src_fd, copied, min(size - copied, _CHUNK))
+        if count == 0:
+            _stalled(copied, size)
+        copied += count
+
+
+STRATEGIES: list[tuple[str, Strategy]] = [("reflink", _reflink)]
+if hasattr(os, "copy_file_range"):
+    STRATEGIES.append(("copy_file_range", _copy_file_range))
+if hasattr(os, "sendfile"):
+    STRATEGIES.append(("sendfile", _sendfile))
+
+
+def copy_file(
+    src: str, dst: str, strategies: Optional[list[tuple[str, Strategy]]] = None
+) -> str:
+    """
+    Copy the contents of src into dst and return the strategy used
+
+    Strategies are tried in order (reflink, copy_file_range, sendfile) and
+    the first one the filesystem supports wins; a plain buffered copy is
+    only the last resort
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        # empty files, or pseudo files reporting size 0, go buffered
+        if size > 0:
+            for name, strategy in STRATEGIES if strategies is None else strategies:
+                try:
+                    strategy(fsrc.fileno(), fdst.fileno(), size)
+                    return name
+                except OSError as error:
+                    if error.errno not in _UNSUPPORTED:
+                        raise
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst, _BUFFER)
+        return "buffered"
+
+
+def copy2(src: str, dst: str) -> str:
+    """Like shutil.copy2, but through copy_file"""
+    strategy = copy_file(src, dst)
+    shutil.copystat(src, dst)
+    return strategy
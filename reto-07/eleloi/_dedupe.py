@@ -0,0 +1,112 @@
+from collections import defaultdict
+from contextlib import contextmanager
+import hashlib
+import os
+import threading
+from typing import Iterator, Optional
+
+from _scanner import scan_files
+
+BLOCK_SIZE = 64 * 1024
+
+
+def _partial_hash(path: str, size: int) -> bytes:
+    """Hash of the first and last blocks, the whole file when it's small"""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        digest.update(f.read(BLOCK_SIZE))
+        if size > 2 * BLOCK_SIZE:
+            f.seek(-BLOCK_SIZE, os.SEEK_END)
+        digest.update(f.read(BLOCK_SIZE))
+    return digest.digest()
+
+
+def _full_hash(path: str) -> bytes:
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+class DedupeIndex:
+    """
+    Content index of an out directory, hashed lazily in stages
+
+    Files are compared by size first, then by a hash of their first and
+    last blocks and only then by a full hash, so most comparisons never
+    read whole files. Hashes are computed on demand and cached
+    """
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._buckets: dict[int, threading.Lock] = defaultdict(threading.Lock)
+        self._by_size: dict[int, list[str]] = defaultdict(list)
+        self._partial: dict[str, bytes] = {}
+        self._full: dict[str, bytes] = {}
+        for entry in scan_files(path):
+            self._by_size[entry.stat().st_size].append(entry.path)
+
+    def _partial_of(self, path: str, size: int) -> bytes:
+        with self._lock:
+            digest = self._partial.get(path)
+        if digest is None:
+            digest = _partial_hash(path, size)
+            with self._lock:
+                self._partial[path] = digest
+        return digest
+
+    def _full_of(self, path: str) -> bytes:
+        with self._lock:
+            digest = self._full.get(path)
+        if digest is None:
+            digest = _full_hash(path)
+            with self._lock:
+                self._full[path] = digest
+        return digest
+
+    @contextmanager
+    def bucket(self, src: str) -> Iterator[None]:
+        """
+        Hold the lock of src's size for a whole find -> copy -> add
+
+        Only files of the same size can be duplicates, so serializing per
+        size is enough for concurrent copies of identical sources to see
+        each other, while different sizes still copy in parallel
+        """
+        size = os.stat(src).st_size
+        with self._lock:
+            lock = self._buckets[size]
+        with lock:
+            yield
+
+    def find(self, src: str) -> Optional[str]:
+        """
+        Return a file of the index with the same content as src
+
+        The index lock only guards its dicts, every hash is computed
+        outside it
+        """
+        size = os.stat(src).st_size
+        with self._lock:
+            candidates = list(self._by_size.get(size, ()))
+        if not candidates:
+            return None
+        partial = _partial_hash(src, size)
+        candidates = [
+            path
+            for path in candidates
+            if self._partial_of(path, size) == partial
+        ]
+        if not candidates or size <= 2 * BLOCK_SIZE:
+            # small files were hashed whole by the partial hash
+            return candidates[0] if candidates else None
+        full = _full_hash(src)
+        for path in candidates:
+            if self._full_of(path) == full:
+                return path
+        return None
+
+    def add(self, path: str) -> None:
+        with self._lock:
+            self._by_size[os.stat(path).st_size].append(path)
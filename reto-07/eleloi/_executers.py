@@ -1,7 +1,15 @@
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 import os
-import shutil
 import pathlib
+from typing import Iterator, Optional
+
+import _config
+import _copy_backend
+import _mover
+from _dedupe import DedupeIndex
+from _filters import ExtensionMatcher
+from _scanner import scan_files
 
 
 def _create_folders_if_dont_exists(paths: list[str]) -> None:
@@ -10,13 +18,48 @@ def _create_folders_if_dont_exists(paths: list[str]) -> None:
         path.mkdir(parents=True, exist_ok=True)
 
 
-def _get_extension_of_filter(filter: str) -> str:
+def _matching_files(
+    in_path: str, extension_filter: str, filenames: Optional[list[str]]
+) -> Iterator[str]:
     """
-    Remove * character
+    Names of the files to process
 
-    the filter has the form *.jpg or *.zzz garanteed by pydantic validator
+    filenames comes already routed by the planner when several directories
+    share the same input path, otherwise in_path is scanned here
+    """
+    if filenames is not None:
+        yield from filenames
+        return
+    matcher = ExtensionMatcher([extension_filter])
+    for entry in scan_files(in_path):
+        if matcher.match(entry.name):
+            yield entry.name
+
+
+def _copy_file(
+    src: str,
+    dst: str,
+    index: Optional[DedupeIndex] = None,
+    dedupe: _config.Dedupe = _config.Dedupe.NONE,
+) -> Optional[str]:
     """
-    return filter[1:].lower()
+    Copy src to dst, deduplicating against index
+
+    Returns the strategy used ("hardlink" for a linked duplicate), or None
+    when the file was a duplicate and got skipped
+    """
+    if index is None:
+        return _copy_backend.copy2(src, dst)
+    with index.bucket(src):
+        same = index.find(src)
+        if same and dedupe == _config.Dedupe.SKIP:
+            return None
+        if same:
+            os.link(same, dst)
+            return "hardlink"
+        strategy = _copy_backend.copy2(src, dst)
+        index.add(dst)
+        return strategy
 
 
 @dataclass
@@ -25,6 +68,7 @@ class NoneExecuter:
     in_path: str
     out_path: str
     extension_filter: str
+    filenames: Optional[list[str]] = None
 
     def run(self) -> None:
         _create_folders_if_dont_exists([self.in_path, self.out_path])
@@ -37,23 +81,38 @@ class CopyExecuter:
     in_path: str
     out_path: str
     extension_filter: str
+    filenames: Optional[list[str]] = None
+    dedupe: _config.Dedupe = _config.Dedupe.NONE
+    # shared by the pool between the executers of the same out_path
+    index: Optional[DedupeIndex] = None
+    strategies: Counter = field(default_factory=Counter, init=False)
+    # bytes of the files copied or linked, skipped duplicates excluded
+    bytes: int = field(default=0, init=False)
 
     def run(self) -> None:
         """Copy without overwrite"""
         _create_folders_if_dont_exists([self.in_path, self.out_path])
-        in_files = os.listdir(self.in_path)
-        out_files = os.listdir(self.out_path)
-        extension = _get_extension_of_filter(self.extension_filter)
-
-        for filename in [
-            x
-            for x in in_files
-            if x not in out_files and x.lower().endswith(extension)
-        ]:
-            shutil.copy2(
-                os.path.join(self.in_path, filename),
-                os.path.join(self.out_path, filename),
-            )
+        out_files = set(os.listdir(self.out_path))
+        index = self.index
+        if index is None and self.dedupe != _config.Dedupe.NONE:
+            index = DedupeIndex(self.out_path)
+
+        for filename in _matching_files(
+            self.in_path, self.extension_filter, self.filenames
+        ):
+            if filename in out_files:
+                continue
+            src = os.path.join(self.in_path, filename)
+            dst = os.path.join(self.out_path, filename)
+            try:
+                strategy = _copy_file(src, dst, index, self.dedupe)
+            except FileNotFoundError:
+                # already moved by a previous directory sharing in_path
+                continue
+            if strategy is not None:
+                # which copy strategy each file used, for reporting
+                self.strategies[strategy] += 1
+                self.bytes += os.stat(dst).st_size
 
 
 @dataclass
@@ -62,16 +121,22 @@ class MoveExecuter:
     in_path: str
     out_path: str
     extension_filter: str
+    filenames: Optional[list[str]] = None
+    report: _mover.MoveReport = field(
+        default_factory=_mover.MoveReport, init=False
+    )
 
     def run(self) -> None:
         """Move with overwrite"""
         _create_folders_if_dont_exists([self.in_path, self.out_path])
-        extension = _get_extension_of_filter(self.extension_filter)
-
-        for filename in [
-            x for x in os.listdir(self.in_path) if x.lower().endswith(extension)
-        ]:
-            shutil.move(
+        if os.path.realpath(self.in_path) == os.path.realpath(self.out_path):
+            return
+        self.report = _mover.move_files(
+            (
                 os.path.join(self.in_path, filename),
                 os.path.join(self.out_path, filename),
             )
+            for filename in _matching_files(
+                self.in_path, self.extension_filter, self.filenames
+            )
+        )
@@ -0,0 +1,36 @@
+from collections import defaultdict
+
+
+class ExtensionMatcher:
+    """
+    Match filenames against many *.ext filters in a single pass
+
+    Extensions are kept in a hash table grouped by length, so each filename
+    costs one lookup per distinct extension length and only its tail is
+    lowercased, instead of lowercasing the whole name once per filter
+    """
+
+    def __init__(self, filters: list[str]) -> None:
+        self._by_length: dict[int, dict[str, set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        for filter_ in filters:
+            extension = _get_extension_of_filter(filter_)
+            self._by_length[len(extension)][extension].add(filter_)
+
+    def match(self, filename: str) -> set[str]:
+        """Return the filters the filename matches"""
+        matched: set[str] = set()
+        for length, extensions in self._by_length.items():
+            if len(filename) >= length:
+                matched.update(extensions.get(filename[-length:].lower(), ()))
+        return matched
+
+
+def _get_extension_of_filter(filter: str) -> str:
+    """
+    Remove * character
+
+    the filter has the form *.jpg or *.zzz garanteed by pydantic validator
+    """
+    return filter[1:].lower()
@@ -0,0 +1,76 @@
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+from typing import Iterable
+
+import _copy_backend
+
+
+def _device(path: str) -> int:
+    return os.stat(path).st_dev
+
+
+@dataclass
+class MoveReport:
+    renamed: int = 0
+    copied: int = 0
+    bytes: int = 0
+    strategies: Counter = field(default_factory=Counter)
+
+
+def move_files(pairs: Iterable[tuple[str, str]]) -> MoveReport:
+    """
+    Move every (src, dst) pair, overwriting dst atomically
+
+    Pairs are grouped by the device of their directories (one stat per
+    directory, not per file). Same-device moves are a single os.replace, so
+    there is never a window where the file exists in neither place.
+    Cross-device moves stream through the copy backend into a temporary
+    file next to dst, os.replace it into place, and unlink the sources in a
+    batch once every copy has landed
+    """
+    report = MoveReport()
+    devices: dict[str, int] = {}
+    cross_device: list[tuple[str, str]] = []
+
+    def device_of(path: str) -> int:
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in devices:
+            devices[directory] = _device(directory)
+        return devices[directory]
+
+    for src, dst in pairs:
+        if device_of(src) != device_of(dst):
+            cross_device.append((src, dst))
+            continue
+        try:
+            os.replace(src, dst)
+        except FileNotFoundError:
+            # already moved by a previous directory sharing the same in_path
+            continue
+        report.renamed += 1
+        report.bytes += os.stat(dst).st_size
+
+    copied: list[str] = []
+    for src, dst in cross_device:
+        tmp = os.path.join(
+            os.path.dirname(dst), f".{os.path.basename(dst)}.diogenes-tmp"
+        )
+        try:
+            report.strategies[_copy_backend.copy2(src, tmp)] += 1
+        except FileNotFoundError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            continue
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        report.bytes += os.stat(tmp).st_size
+        os.replace(tmp, dst)
+        copied.append(src)
+        report.copied += 1
+
+    for src in copied:
+        os.remove(src)
+    return report
@@ -0,0 +1,92 @@
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+
+import _config
+from _filters import ExtensionMatcher
+from _scanner import scan_files
+
+
+def group_by_input(
+    directorios: list[_config.UserDir],
+) -> dict[str, list[_config.UserDir]]:
+    """
+    Group the configured directories by their resolved input path
+
+    Both the groups and the directories inside each group keep the order of
+    the configuration file, so when several entries match the same file
+    their actions always run in that order
+    """
+    groups: dict[str, list[_config.UserDir]] = defaultdict(list)
+    for directory in directorios:
+        groups[os.path.realpath(directory.in_)].append(directory)
+    return groups
+
+
+def route(in_path: str, filters: list[str]) -> dict[str, list[str]]:
+    """
+    Scan in_path once and bucket its files by every filter they match
+    """
+    matcher = ExtensionMatcher(filters)
+    routed: dict[str, list[str]] = {filter_: [] for filter_ in filters}
+    for entry in scan_files(in_path):
+        for filter_ in matcher.match(entry.name):
+            routed[filter_].append(entry.name)
+    return routed
+
+
+@dataclass
+class Step:
+    action: _config.Action
+    in_path: str
+    out_path: str
+    filter_: str
+    filenames: list[str]
+    dedupe: _config.Dedupe = _config.Dedupe.NONE
+
+    def __str__(self) -> str:
+        return (
+            f"{self.action.value} {len(self.filenames)} files "
+            f"{self.in_path} -> {self.out_path} ({self.filter_})"
+        )
+
+
+def plan(directorios: list[_config.UserDir]) -> list[Step]:
+    """
+    Turn the configuration into the explicit list of steps to execute
+
+    Only the first action of a directory reads from its input; the chained
+    ones run out -> out, where a copy finds every file already there and a
+    move leaves it where it is, so they are dropped together with "none".
+    A step whose output is its own input changes nothing and is dropped too,
+    and a file moved by one step is no longer offered to the later ones
+    """
+    steps: list[Step] = []
+    for in_path, directories in group_by_input(directorios).items():
+        if os.path.isdir(in_path):
+            routed = route(in_path, [d.filter_ for d in directories])
+        else:
+            routed = {d.filter_: [] for d in directories}
+        moved: set[str] = set()
+        for directory in directories:
+            action = directory.actions[0] if directory.actions else None
+            if action in (None, _config.Action.NONE):
+                continue
+            if os.path.realpath(directory.out) == in_path:
+                continue
+            filenames = [
+                name for name in routed[directory.filter_] if name not in moved
+            ]
+            if action == _config.Action.MOVE:
+                moved.update(filenames)
+            steps.append(
+                Step(
+                    action,
+                    directory.in_,
+                    directory.out,
+                    directory.filter_,
+                    filenames,
+                    directory.dedupe,
+                )
+            )
+    return steps
@@ -0,0 +1,138 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
+import threading
+import time
+from typing import Optional
+
+import _config
+from _dedupe import DedupeIndex
+from _executers import (
+    CopyExecuter,
+    MoveExecuter,
+    _create_folders_if_dont_exists,
+    _matching_files,
+)
+
+
+@dataclass
+class PoolReport:
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    # moves done by a rename and by copy + unlink across devices
+    renamed: int = 0
+    copied: int = 0
+    # copy backend strategy (or "hardlink" for a duplicate) per file
+    strategies: Counter = field(default_factory=Counter)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate bytes per second of the whole run"""
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class PoolExecuter:
+    """
+    Copy or move files with a bounded thread pool
+
+    The files are split in one batch per worker and every batch runs through
+    a CopyExecuter or MoveExecuter, so moves keep their per-device grouping
+    and batched unlink and copies share one dedupe index. run() only returns
+    once every batch is done, so the next action of the chain (or the next
+    directory sharing the same in_path) never overtakes this one: a copy
+    always lands before a later move of the same file. Besides max_workers,
+    a semaphore per source/destination device caps how many batches are in
+    flight on it
+    """
+
+    in_path: str
+    out_path: str
+    extension_filter: str
+    filenames: Optional[list[str]] = None
+    action: _config.Action = _config.Action.COPY
+    max_workers: int = 8
+    max_per_device: int = 4
+    dedupe: _config.Dedupe = _config.Dedupe.NONE
+    report: PoolReport = field(default_factory=PoolReport, init=False)
+
+    def run(self) -> None:
+        _create_folders_if_dont_exists([self.in_path, self.out_path])
+        if self.action == _config.Action.NONE:
+            return
+        if os.path.realpath(self.in_path) == os.path.realpath(self.out_path):
+            return
+        devices = sorted(
+            {os.stat(self.in_path).st_dev, os.stat(self.out_path).st_dev}
+        )
+        # one semaphore per device of this run, so max_per_device is the
+        # one this executer was built with; acquired in device order
+        slots = [
+            threading.BoundedSemaphore(self.max_per_device) for _ in devices
+        ]
+        out_files = set(os.listdir(self.out_path))
+        lock = threading.Lock()
+        index = (
+            DedupeIndex(self.out_path)
+            if self.action == _config.Action.COPY
+            and self.dedupe != _config.Dedupe.NONE
+            else None
+        )
+        filenames = [
+            filename
+            for filename in _matching_files(
+                self.in_path, self.extension_filter, self.filenames
+            )
+            if self.action == _config.Action.MOVE or filename not in out_files
+        ]
+
+        def task(batch: list[str]) -> None:
+            for slot in slots:
+                slot.acquire()
+            try:
+                if self.action == _config.Action.COPY:
+                    copier = CopyExecuter(
+                        self.in_path,
+                        self.out_path,
+                        self.extension_filter,
+                        batch,
+                        self.dedupe,
+                        index,
+                    )
+                    copier.run()
+                    strategies = copier.strategies
+                    files = sum(strategies.values())
+                    size = copier.bytes
+                    renamed = copied = 0
+                else:
+                    mover = MoveExecuter(
+                        self.in_path,
+                        self.out_path,
+                        self.extension_filter,
+                        batch,
+                    )
+                    mover.run()
+                    strategies = mover.report.strategies
+                    renamed, copied = mover.report.renamed, mover.report.copied
+                    files = renamed + copied
+                    size = mover.report.bytes
+            finally:
+                for slot in reversed(slots):
+                    slot.release()
+            with lock:
+                self.report.files += files
+                self.report.bytes += size
+                self.report.renamed += renamed
+                self.report.copied += copied
+                self.report.strategies.update(strategies)
+
+        workers = max(1, min(self.max_workers, len(filenames)))
+        batches = [filenames[n::workers] for n in range(workers)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(task, batch) for batch in batches if batch]
+        for future in futures:
+            future.result()
+        self.report.seconds = time.perf_counter() - start
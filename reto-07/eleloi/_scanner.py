@@ -0,0 +1,15 @@
+import os
+from typing import Iterator
+
+
+def scan_files(path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield the regular files of path lazily
+
+    os.scandir caches the entry type, so is_file() doesn't need a stat call
+    and the listing is never held in memory at once
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
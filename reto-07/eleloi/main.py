@@ -1,6 +1,9 @@
-from typing import Protocol
+import sys
+from typing import Optional, Protocol
 import _config
 import _executers
+import _planner
+import _pool
 
 CONFIG_PATH = "config.toml"
 
@@ -9,13 +12,21 @@ class Executer(Protocol):
     in_path: str
     out_path: str
     extension_filter: str
+    filenames: Optional[list[str]]
 
     def run(self) -> None:
         ...
 
 
 def execute_action(
-    in_path: str, out_path: str, filter_: str, action: _config.Action
+    in_path: str,
+    out_path: str,
+    filter_: str,
+    action: _config.Action,
+    filenames: Optional[list[str]] = None,
+    max_workers: int = 1,
+    max_per_device: int = 1,
+    dedupe: _config.Dedupe = _config.Dedupe.NONE,
 ):
 
     executers: dict[_config.Action, Executer] = {
@@ -23,31 +34,72 @@ def execute_action(
             in_path=in_path,
             out_path=out_path,
             extension_filter=filter_,
+            filenames=filenames,
         ),
-        _config.Action.COPY: _executers.CopyExecuter(
+        _config.Action.COPY: _pool.PoolExecuter(
             in_path=in_path,
             out_path=out_path,
             extension_filter=filter_,
+            filenames=filenames,
+            action=_config.Action.COPY,
+            max_workers=max_workers,
+            max_per_device=max_per_device,
+            dedupe=dedupe,
         ),
-        _config.Action.MOVE: _executers.MoveExecuter(
+        _config.Action.MOVE: _pool.PoolExecuter(
             in_path=in_path,
             out_path=out_path,
             extension_filter=filter_,
+            filenames=filenames,
+            action=_config.Action.MOVE,
+            max_workers=max_workers,
+            max_per_device=max_per_device,
         ),
     }
 
-    executers[action].run()
+    executer = executers[action]
+    executer.run()
+    if isinstance(executer, _pool.PoolExecuter) and executer.report.files:
+        report = executer.report
+        print(
+            f"{action.value} {in_path} -> {out_path}: {report.files} files, "
+            f"{report.bytes / 2**20:.1f} MiB in {report.seconds:.2f}s "
+            f"({report.throughput / 2**20:.1f} MiB/s)"
+        )
+        if action == _config.Action.MOVE:
+            print(f"  renamed {report.renamed}, copied {report.copied}")
+        if report.strategies:
+            strategies = ", ".join(
+                f"{name} {count}"
+                for name, count in report.strategies.most_common()
+            )
+            print(f"  strategies: {strategies}")
 
 
-def main():
+def main(dry_run: bool = False):
     config = _config.read(CONFIG_PATH)
-    for directory in config.directorios:
-        for idx, action in enumerate(directory.actions):
-            in_dir = directory.in_ if idx == 0 else directory.out
-            out_dir = directory.out
-            filter_ = directory.filter_
-            execute_action(in_dir, out_dir, filter_, action)
+    steps = _planner.plan(config.directorios)
+    if dry_run:
+        for step in steps:
+            print(step)
+            for filename in step.filenames:
+                print(f"  {filename}")
+        return
+    _executers._create_folders_if_dont_exists(
+        [path for d in config.directorios for path in (d.in_, d.out)]
+    )
+    for step in steps:
+        execute_action(
+            step.in_path,
+            step.out_path,
+            step.filter_,
+            step.action,
+            step.filenames,
+            config.max_workers,
+            config.max_per_device,
+            step.dedupe,
+        )
 
 
 if __name__ == "__main__":
-    main()
+    main(dry_run="--dry-run" in sys.argv)
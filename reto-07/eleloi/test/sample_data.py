@@ -1,6 +1,9 @@
+import pathlib
+
 import _config
 
 SAMPLE_DIR = "sample_data"
+SAMPLE_TEXT = "sample data"
 
 none_dir = _config.UserDir(
     **{
@@ -28,3 +31,23 @@ move_dir = _config.UserDir(
         "filter": "*.jpg",
     }
 )
+
+
+def sample_dirs(
+    tmp_path: pathlib.Path, jpg: int = 0, txt: int = 0
+) -> tuple[pathlib.Path, pathlib.Path]:
+    """in and out directories under tmp_path, with sample files in in"""
+    in_path = tmp_path / "in"
+    out_path = tmp_path / "out"
+    in_path.mkdir()
+    out_path.mkdir()
+    for extension, num_files in (("jpg", jpg), ("txt", txt)):
+        for x in range(0, num_files):
+            (in_path / f"sample{x}.{extension}").write_text(SAMPLE_TEXT)
+    return in_path, out_path
+
+
+def sample_file(path: pathlib.Path, size: int) -> pathlib.Path:
+    """A file of size bytes (rounded down to 256) that isn't all zeros"""
+    path.write_bytes(bytes(range(256)) * (size // 256))
+    return path
@@ -0,0 +1,71 @@
+import errno
+
+import pytest
+
+import _copy_backend
+from .sample_data import sample_file
+
+
+def test_copy_file_copies_contents(tmp_path):
+    src = sample_file(tmp_path / "src.iso", 1 << 16)
+    dst = tmp_path / "dst.iso"
+
+    strategy = _copy_backend.copy_file(str(src), str(dst))
+
+    assert strategy in {name for name, _ in _copy_backend.STRATEGIES}
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_falls_back_when_unsupported(tmp_path):
+    src = sample_file(tmp_path / "src.iso", 1 << 16)
+    dst = tmp_path / "dst.iso"
+
+    def unsupported(src_fd: int, dst_fd: int, size: int) -> None:
+        raise OSError(errno.EXDEV, "cross device")
+
+    strategy = _copy_backend.copy_file(
+        str(src), str(dst), [("unsupported", unsupported)]
+    )
+
+    assert strategy == "buffered"
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_empty_file(tmp_path):
+    src = tmp_path / "empty"
+    src.touch()
+    dst = tmp_path / "dst"
+
+    assert _copy_backend.copy_file(str(src), str(dst)) == "buffered"
+    assert dst.read_bytes() == b""
+
+
+def test_copy_file_falls_back_when_kernel_copy_makes_no_progress(
+    tmp_path, monkeypatch
+):
+    src = sample_file(tmp_path / "src.iso", 1 << 16)
+    dst = tmp_path / "dst.iso"
+    monkeypatch.setattr(_copy_backend.os, "sendfile", lambda *args: 0)
+
+    strategy = _copy_backend.copy_file(
+        str(src), str(dst), [("sendfile", _copy_backend._sendfile)]
+    )
+
+    assert strategy == "buffered"
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_file_fails_on_a_short_kernel_copy(tmp_path, monkeypatch):
+    src = sample_file(tmp_path / "src.iso", 1 << 16)
+    dst = tmp_path / "dst.iso"
+    counts = iter([1024, 0])
+    monkeypatch.setattr(
+        _copy_backend.os, "sendfile", lambda *args: next(counts)
+    )
+
+    with pytest.raises(OSError) as error:
+        _copy_backend.copy_file(
+            str(src), str(dst), [("sendfile", _copy_backend._sendfile)]
+        )
+
+    assert error.value.errno == errno.EIO
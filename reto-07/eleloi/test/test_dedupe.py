@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+import time
+
+import _config
+import _copy_backend
+import _dedupe
+import _executers
+import _pool
+from .sample_data import SAMPLE_TEXT, sample_dirs
+
+
+def _write(path, data: bytes):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_find_matches_identical_content(tmp_path):
+    block = _dedupe.BLOCK_SIZE
+    big = os.urandom(4 * block)
+    in_path, out_path = sample_dirs(tmp_path)
+    _write(out_path / "foo.iso", big)
+    _write(out_path / "small.jpg", b"sample data")
+    index = _dedupe.DedupeIndex(str(out_path))
+
+    same_big = _write(in_path / "foo(1).iso", big)
+    # same size, first and last blocks, different middle
+    changed = big[: 2 * block] + bytes(block) + big[3 * block :]
+    middle = _write(in_path / "foo(2).iso", changed)
+    same_small = _write(in_path / "small(1).jpg", b"sample data")
+    different = _write(in_path / "small(2).jpg", b"sample date")
+
+    assert index.find(same_big) == str(out_path / "foo.iso")
+    assert index.find(middle) is None
+    assert index.find(same_small) == str(out_path / "small.jpg")
+    assert index.find(different) is None
+
+
+def _copy_dirs(tmp_path):
+    """foo(1).jpg in in duplicates foo.jpg in out, bar.jpg is new"""
+    in_path, out_path = sample_dirs(tmp_path)
+    (out_path / "foo.jpg").write_text(SAMPLE_TEXT)
+    (in_path / "foo(1).jpg").write_text(SAMPLE_TEXT)
+    (in_path / "bar.jpg").write_text("other data")
+    return str(in_path), str(out_path)
+
+
+def test_copy_executer_skips_duplicates(tmp_path):
+    in_path, out_path = _copy_dirs(tmp_path)
+    executer = _executers.CopyExecuter(
+        in_path, out_path, "*.jpg", dedupe=_config.Dedupe.SKIP
+    )
+
+    executer.run()
+
+    assert sorted(os.listdir(out_path)) == ["bar.jpg", "foo.jpg"]
+
+
+def test_copy_executer_hardlinks_duplicates(tmp_path):
+    in_path, out_path = _copy_dirs(tmp_path)
+    executer = _executers.CopyExecuter(
+        in_path, out_path, "*.jpg", dedupe=_config.Dedupe.HARDLINK
+    )
+
+    executer.run()
+
+    assert sorted(os.listdir(out_path)) == ["bar.jpg", "foo(1).jpg", "foo.jpg"]
+    linked = os.stat(os.path.join(out_path, "foo(1).jpg"))
+    assert linked.st_ino == os.stat(os.path.join(out_path, "foo.jpg")).st_ino
+
+
+def test_pool_skips_duplicates_copied_at_the_same_time(tmp_path, monkeypatch):
+    in_path, out_path = sample_dirs(tmp_path, jpg=4)
+    copy2 = _copy_backend.copy2
+
+    def slow_copy2(src: str, dst: str) -> str:
+        time.sleep(0.05)
+        return copy2(src, dst)
+
+    monkeypatch.setattr(_copy_backend, "copy2", slow_copy2)
+    executer = _pool.PoolExecuter(
+        str(in_path), str(out_path), "*.jpg", dedupe=_config.Dedupe.SKIP
+    )
+
+    executer.run()
+
+    assert len(os.listdir(out_path)) == 1
+    # the skipped duplicates were not transferred
+    assert executer.report.files == 1
+    assert executer.report.bytes == len(SAMPLE_TEXT)
+
+
+def test_find_hashes_different_sizes_in_parallel(tmp_path, monkeypatch):
+    in_path, out_path = sample_dirs(tmp_path)
+    _write(out_path / "foo.jpg", b"sample data")
+    _write(out_path / "bar.jpg", b"other sample data")
+    index = _dedupe.DedupeIndex(str(out_path))
+    sources = [
+        _write(in_path / "foo(1).jpg", b"sample data"),
+        _write(in_path / "bar(1).jpg", b"other sample data"),
+    ]
+    # both hashes have to be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    partial_hash = _dedupe._partial_hash
+
+    def waiting_partial_hash(path: str, size: int) -> bytes:
+        barrier.wait()
+        return partial_hash(path, size)
+
+    monkeypatch.setattr(_dedupe, "_partial_hash", waiting_partial_hash)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        found = list(pool.map(index.find, sources))
+
+    assert found == [
+        str(out_path / "foo.jpg"),
+        str(out_path / "bar.jpg"),
+    ]
@@ -0,0 +1,17 @@
+import _filters
+
+
+def test_matcher_returns_every_matching_filter():
+    matcher = _filters.ExtensionMatcher(["*.jpg", "*.JPG", "*.png", "*.gz"])
+
+    assert matcher.match("photo.jpg") == {"*.jpg", "*.JPG"}
+    assert matcher.match("PHOTO.PNG") == {"*.png"}
+    assert matcher.match("backup.tar.gz") == {"*.gz"}
+
+
+def test_matcher_rejects_other_extensions():
+    matcher = _filters.ExtensionMatcher(["*.jpg"])
+
+    assert matcher.match("photo.jpeg") == set()
+    assert matcher.match("jpg") == set()
+    assert matcher.match("") == set()
@@ -0,0 +1,49 @@
+import os
+
+import _mover
+from .sample_data import SAMPLE_TEXT, sample_dirs
+
+
+def test_same_device_move_is_a_rename(tmp_path):
+    in_path, out_path = sample_dirs(tmp_path)
+    src = in_path / "a.jpg"
+    src.write_text("new")
+    (out_path / "a.jpg").write_text("old")
+    inode = src.stat().st_ino
+
+    report = _mover.move_files([(str(src), str(out_path / "a.jpg"))])
+
+    assert report.renamed == 1 and report.copied == 0
+    assert not src.exists()
+    assert (out_path / "a.jpg").read_text() == "new"
+    assert (out_path / "a.jpg").stat().st_ino == inode
+
+
+def test_cross_device_move_copies_then_unlinks(tmp_path, monkeypatch):
+    in_path, out_path = sample_dirs(tmp_path, jpg=3)
+    (out_path / "sample0.jpg").write_text("old")
+    monkeypatch.setattr(
+        _mover, "_device", lambda path: 1 if path == str(in_path) else 2
+    )
+
+    report = _mover.move_files(
+        (str(in_path / name), str(out_path / name))
+        for name in sorted(os.listdir(in_path))
+    )
+
+    assert report.renamed == 0 and report.copied == 3
+    assert os.listdir(in_path) == []
+    assert sorted(os.listdir(out_path)) == [
+        "sample0.jpg",
+        "sample1.jpg",
+        "sample2.jpg",
+    ]
+    assert (out_path / "sample0.jpg").read_text() == SAMPLE_TEXT
+
+
+def test_missing_sources_are_skipped(tmp_path):
+    in_path, out_path = sample_dirs(tmp_path)
+
+    report = _mover.move_files([(str(in_path / "x"), str(out_path / "x"))])
+
+    assert report.renamed == 0 and report.copied == 0
@@ -0,0 +1,68 @@
+import _config
+import _planner
+
+
+def _user_dir(
+    in_: str, out: str, filter_: str, actions=(_config.Action.COPY,)
+) -> _config.UserDir:
+    return _config.UserDir(
+        **{
+            "in": in_,
+            "out": out,
+            "actions": list(actions),
+            "filter": filter_,
+        }
+    )
+
+
+def test_group_by_input_keeps_configuration_order(tmp_path):
+    first = _user_dir(str(tmp_path), "out1", "*.jpg")
+    other = _user_dir(str(tmp_path / "other"), "out2", "*.jpg")
+    second = _user_dir(f"{tmp_path}/", "out3", "*.png")
+
+    groups = _planner.group_by_input([first, other, second])
+
+    assert list(groups.values()) == [[first, second], [other]]
+
+
+def test_route_scans_once_for_every_filter(tmp_path):
+    for filename in ["a.jpg", "b.JPG", "c.png", "d.txt"]:
+        (tmp_path / filename).write_text("sample data")
+
+    routed = _planner.route(str(tmp_path), ["*.jpg", "*.png", "*.gif"])
+
+    assert sorted(routed["*.jpg"]) == ["a.jpg", "b.JPG"]
+    assert routed["*.png"] == ["c.png"]
+    assert routed["*.gif"] == []
+
+
+def test_plan_fuses_chained_and_none_actions(tmp_path):
+    for filename in ["a.jpg", "b.png"]:
+        (tmp_path / filename).write_text("sample data")
+    chained = _user_dir(
+        str(tmp_path),
+        str(tmp_path / "out1"),
+        "*.jpg",
+        [_config.Action.COPY, _config.Action.MOVE],
+    )
+    nothing = _user_dir(
+        str(tmp_path), str(tmp_path / "out2"), "*.png", [_config.Action.NONE]
+    )
+    itself = _user_dir(str(tmp_path), str(tmp_path), "*.png")
+
+    steps = _planner.plan([chained, nothing, itself])
+
+    assert [(s.action, s.out_path, s.filenames) for s in steps] == [
+        (_config.Action.COPY, str(tmp_path / "out1"), ["a.jpg"])
+    ]
+    assert not (tmp_path / "out1").exists()
+
+
+def test_plan_does_not_offer_moved_files_again(tmp_path):
+    (tmp_path / "a.jpg").write_text("sample data")
+    move = _user_dir(str(tmp_path), "out1", "*.jpg", [_config.Action.MOVE])
+    copy = _user_dir(str(tmp_path), "out2", "*.jpg")
+
+    steps = _planner.plan([move, copy])
+
+    assert [s.filenames for s in steps] == [["a.jpg"], []]
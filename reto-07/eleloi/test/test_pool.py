@@ -0,0 +1,92 @@
+import os
+import threading
+import time
+
+import _config
+import _copy_backend
+import _pool
+from .sample_data import SAMPLE_TEXT, sample_dirs
+
+
+def test_pool_copies_matching_files(tmp_path):
+    in_path, out_path = sample_dirs(tmp_path, jpg=10, txt=1)
+    executer = _pool.PoolExecuter(str(in_path), str(out_path), "*.jpg")
+
+    executer.run()
+
+    assert len(os.listdir(in_path)) == 11
+    assert len(os.listdir(out_path)) == 10
+    assert executer.report.files == 10
+    assert executer.report.bytes == 10 * len(SAMPLE_TEXT)
+    assert sum(executer.report.strategies.values()) == 10
+
+
+def test_pool_moves_matching_files(tmp_path):
+    in_path, out_path = sample_dirs(tmp_path, jpg=10, txt=1)
+    executer = _pool.PoolExecuter(
+        str(in_path), str(out_path), "*.jpg", action=_config.Action.MOVE
+    )
+
+    executer.run()
+
+    assert os.listdir(in_path) == ["sample0.txt"]
+    assert len(os.listdir(out_path)) == 10
+    assert executer.report.renamed == 10
+    assert executer.report.copied == 0
+    assert executer.report.bytes == 10 * len(SAMPLE_TEXT)
+
+
+def test_pool_respects_the_per_device_limit(tmp_path, monkeypatch):
+    in_path, out_path = sample_dirs(tmp_path, jpg=12)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    copy2 = _copy_backend.copy2
+
+    def slow_copy2(src: str, dst: str) -> str:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return copy2(src, dst)
+
+    monkeypatch.setattr(_copy_backend, "copy2", slow_copy2)
+    executer = _pool.PoolExecuter(
+        str(in_path), str(out_path), "*.jpg", max_workers=8, max_per_device=2
+    )
+
+    executer.run()
+
+    assert len(os.listdir(out_path)) == 12
+    assert peak <= 2
+
+
+def test_pool_uses_its_own_per_device_limit(tmp_path, monkeypatch):
+    first = tmp_path / "first"
+    first.mkdir()
+    in_path, out_path = sample_dirs(first, jpg=3)
+    _pool.PoolExecuter(
+        str(in_path), str(out_path), "*.jpg", max_per_device=1
+    ).run()
+    second = tmp_path / "second"
+    second.mkdir()
+    in_path, out_path = sample_dirs(second, jpg=6)
+    # three batches only get past the barrier if they copy at once
+    barrier = threading.Barrier(3, timeout=5)
+    copy2 = _copy_backend.copy2
+
+    def waiting_copy2(src: str, dst: str) -> str:
+        barrier.wait()
+        return copy2(src, dst)
+
+    monkeypatch.setattr(_copy_backend, "copy2", waiting_copy2)
+    executer = _pool.PoolExecuter(
+        str(in_path), str(out_path), "*.jpg", max_workers=3, max_per_device=3
+    )
+
+    executer.run()
+
+    assert len(os.listdir(out_path)) == 6
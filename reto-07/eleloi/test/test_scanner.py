@@ -0,0 +1,24 @@
+import os
+
+import _scanner
+
+
+def test_scan_files_yields_only_files(tmp_path):
+    (tmp_path / "a.jpg").write_text("sample data")
+    (tmp_path / "b.txt").write_text("sample data")
+    (tmp_path / "subdir.jpg").mkdir()
+
+    names = {entry.name for entry in _scanner.scan_files(str(tmp_path))}
+
+    assert names == {"a.jpg", "b.txt"}
+
+
+def test_scan_files_is_lazy(tmp_path):
+    for x in range(0, 3):
+        (tmp_path / f"sample{x}.jpg").write_text("sample data")
+
+    entries = _scanner.scan_files(str(tmp_path))
+    first = next(entries)
+
+    assert isinstance(first, os.DirEntry)
+    assert len(list(entries)) == 2
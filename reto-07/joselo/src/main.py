@@ -55,8 +55,8 @@ def main(app, config):
         list_all(dir_in, dir_out)
 
         # Ejecutar las acciones.
+        filtro = glob_factory(item['filter'])
         for action_name in item['actions']:
-            filtro = glob_factory(item['filter'])
             action[action_name](dir_in, dir_out, fltr=filtro)
 
         # Ver el contenido de los directorios DESPUÉS de la acción.
@@ -24,8 +24,10 @@
 
 
 import fnmatch
+import fastcopy
 import os
 from pathlib import Path
+import re
 import shutil
 
 
@@ -59,9 +61,56 @@ def list_all(d_in: Path, d_out: Path) -> None:
 #
 # Ver https://gist.github.com/jlnc/522598f97c1ff64e3e740bea5c5e7387
 #
+def compile_globs(globs: dict[str, str]) -> callable:
+    """Compilar varios filtros en un único matcher.
+
+    Los filtros del tipo '*.jpg' (un '*' seguido de un sufijo literal) van
+    a una tabla hash de sufijos agrupada por longitud, de forma que cada
+    nombre cuesta una búsqueda por cada longitud distinta. El resto de
+    globs se unen en una única expresión regular que descarta de una vez
+    los nombres que no cumplen ninguno.
+
+    Parameters
+    ----------
+    globs : dict[str, str]
+        Las reglas: nombre de la regla -> glob.
+
+    Returns
+    -------
+    callable
+        Una función que recibe un nombre de fichero y devuelve el conjunto
+        de reglas que cumple.
+
+    """
+    suffixes: dict[int, dict[str, set[str]]] = {}
+    patterns: dict[str, re.Pattern] = {}
+    for rule, glb in globs.items():
+        tail = glb[1:]
+        if glb.startswith('*') and tail and \
+                not any(c in tail for c in '*?['):
+            suffixes.setdefault(len(tail), {}).setdefault(
+                tail, set()).add(rule)
+        else:
+            patterns[rule] = re.compile(fnmatch.translate(glb))
+    combined = re.compile('|'.join(
+        f'(?:{p.pattern})' for p in patterns.values())) if patterns else None
+
+    def match(name: str) -> set[str]:
+        rules = set()
+        for length, table in suffixes.items():
+            rules.update(table.get(name[-length:], ()))
+        if combined is not None and combined.match(name):
+            rules.update(rule for rule, p in patterns.items()
+                         if p.match(name))
+        return rules
+    return match
+
+
 def glob_factory(glb: str) -> callable:  # noqa
+    match = compile_globs({glb: glb})
+
     def filter_glob(files: set[str]) -> set[str]:
-        return set(fnmatch.filter(files, glb))
+        return set(f for f in files if match(f))
     return filter_glob
 
 
@@ -100,7 +149,11 @@ def __copy(path_in: Path, path_out: Path,
     for src in fltr(files):
         dest = path_out / src
         if not dest.exists():
-            shutil.copy(path_in / src, path_out, follow_symlinks=False)
+            # Los enlaces simbólicos se copian como enlaces.
+            if (path_in / src).is_symlink():
+                shutil.copy(path_in / src, path_out, follow_symlinks=False)
+            else:
+                fastcopy.copy(path_in / src, path_out)
 
 
 # Un diccionario para recopilar las acciones disponibles.
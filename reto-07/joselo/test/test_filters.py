@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Diogenes, reto 07: test_filters(test)"""
+
+# Copyright (c) 2022 José Lorenzo Nieto Corral <a.k.a. jlnc> <a.k.a. JoseLo>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import fnmatch
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join("../src"))  # noqa
+from utils import compile_globs, glob_factory
+
+GLOBS = {
+    "jpg": "*.jpg",
+    "png": "*.png",
+    "tgz": "*.tar.gz",
+    "all": "*",
+    "img": "img_*.png",
+    "num": "*[0-9].txt",
+    "empty": ""}
+
+NAMES = ["image.jpg", "image.JPG", "image.png", "img_1.png", "a.tar.gz",
+         "text9.txt", "text.txt", ".jpg", "jpg", ""]
+
+
+class FiltersTest(unittest.TestCase):
+
+    def test_compile_globs_matches_fnmatch(self):
+        match = compile_globs(GLOBS)
+        for name in NAMES:
+            expected = set(rule for rule, glb in GLOBS.items()
+                           if fnmatch.fnmatchcase(name, glb))
+            self.assertEqual(match(name), expected)
+
+    def test_glob_factory(self):
+        for glb in GLOBS.values():
+            filtro = glob_factory(glb)
+            self.assertEqual(filtro(set(NAMES)),
+                             set(fnmatch.filter(NAMES, glb)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 from pathlib import Path
-from PIL import Image
+from PIL import Image, ImageOps
 
 class ImageUtils():
     
@@ -17,7 +17,33 @@ class ImageUtils():
         return True
     
     def resize_image(self):
-        if "w" in self.__args and "h" in self.__args:
+        # fit/max_side: cabe en w x h (o en max_side x max_side) sin deformar
+        # cover: llena w x h recortando lo que sobra
+        # contain: cabe en w x h y se rellena con bandas
+        modo = self.__args['mode'] if "mode" in self.__args else None
+        if modo == "max_side" and "max_side" in self.__args:
+            size = (self.__args['max_side'], self.__args['max_side'])
+        elif modo and "w" in self.__args and "h" in self.__args:
+            size = (self.__args['w'], self.__args['h'])
+        else:
+            size = None
+        if modo in ("fit", "max_side") and size:
+            # thumbnail reduce la imagen sobre sí misma, sin copia intermedia
+            self.__image.thumbnail(size)
+            self.__image.save(self.__imageout)
+        elif modo == "cover" and size:
+            ImageOps.fit(self.__image, size).save(self.__imageout)
+        elif modo == "contain" and size:
+            # thumbnail nunca amplía: las bandas rellenan lo que falte,
+            # ImageOps.pad ampliaría las imágenes más pequeñas que w x h
+            self.__image.thumbnail(size)
+            if self.__image.mode == "P":
+                self.__image = self.__image.convert("RGBA")
+            fondo = Image.new(self.__image.mode, size)
+            fondo.paste(self.__image, ((size[0] - self.__image.width) // 2,
+                                       (size[1] - self.__image.height) // 2))
+            fondo.save(self.__imageout)
+        elif "w" in self.__args and "h" in self.__args:
             if (self.__args['w']/self.__args['h']) != (self.__image.width/self.__image.height):
                 print("La Imagen de Salida no guarda las Proporciones")
                 print( f"ejemplo para esta imagen w: {self.__args['w']} "\
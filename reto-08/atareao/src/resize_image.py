@@ -22,7 +22,22 @@
 # SOFTWARE.
 
 from pathlib import Path
+import tempfile
+import time
 from PIL import Image
+from encode_profiles import check_profile, encode_options
+
+# Same gap Image.thumbnail uses: the JPEG decoder and Image.reduce may shrink
+# the image down to twice the target size, the final resample does the rest
+REDUCING_GAP = 2.0
+# Name of every output of a multi-size resize, next to fileout
+TEMPLATE = "{stem}_{width}x{height}{suffix}"
+# stretch: exactly width x height, ignoring the aspect ratio
+# fit: as large as possible inside width x height, keeping the aspect ratio
+# cover: fill width x height keeping the aspect ratio, cropping the overflow
+# contain: fit and pad up to width x height with args["background"]
+# max_side: fit inside a args["max_side"] square
+MODES = ["stretch", "fit", "cover", "contain", "max_side"]
 
 
 class ResizeImage:
@@ -37,16 +52,153 @@ class ResizeImage:
         if not self.__fileout.parent.exists() or \
                 not self.__fileout.parent.is_dir():
             return False
-        if "width" not in self.__args or \
+        if "sizes" in self.__args:
+            try:
+                sizes = self.sizes()
+                self.output(sizes[0])
+            except (TypeError, ValueError, KeyError, IndexError):
+                return False
+            if any(width <= 0 or height <= 0 for width, height in sizes):
+                return False
+        elif self.__args.get("mode") == "max_side":
+            if not isinstance(self.__args.get("max_side"), int) or \
+                    self.__args["max_side"] <= 0:
+                return False
+        elif "width" not in self.__args or \
                 "height" not in self.__args:
             return False
-        return True
+        if self.__args.get("mode", "stretch") not in MODES:
+            return False
+        return check_profile(self.__args)
+
+    def sizes(self):
+        """Target sizes, largest first: args["sizes"] as (width, height)
+        pairs or the single width and height."""
+        if "sizes" not in self.__args:
+            return [self.target_size()]
+        sizes = [(int(width), int(height))
+                 for width, height in self.__args["sizes"]]
+        return sorted(sizes, key=lambda size: size[0] * size[1],
+                      reverse=True)
+
+    def output(self, size):
+        template = self.__args.get("template", TEMPLATE)
+        return self.__fileout.parent / template.format(
+            stem=self.__fileout.stem, suffix=self.__fileout.suffix,
+            width=size[0], height=size[1])
+
+    def pads(self):
+        return self.__args.get("mode") == "contain"
+
+    def target_size(self):
+        if self.__args.get("mode") == "max_side":
+            return self.__args["max_side"], self.__args["max_side"]
+        return self.__args['width'], self.__args['height']
+
+    def draft(self, image):
+        # Only JPEG honours it: libjpeg decodes at 1/2, 1/4 or 1/8 scale
+        # while staying above the requested size. Must run before load().
+        # Sizes are not ordered per axis, so ask for the largest of each
+        sizes = self.sizes()
+        width = max(width for width, _ in sizes)
+        height = max(height for _, height in sizes)
+        image.draft(None, (int(width * REDUCING_GAP),
+                           int(height * REDUCING_GAP)))
+
+    def resize(self, image, size):
+        """Resize image to size according to args["mode"].
+
+        fit, max_side and contain shrink image in place like
+        Image.thumbnail, without a full size intermediate copy, and never
+        enlarge it; cover resamples only the centred region it keeps.
+        """
+        mode = self.__args.get("mode", "stretch")
+        width, height = size
+        if mode == "stretch":
+            return image.resize(size, reducing_gap=REDUCING_GAP)
+        if mode == "cover":
+            scale = max(width / image.width, height / image.height)
+            box_width, box_height = width / scale, height / scale
+            left = (image.width - box_width) / 2
+            top = (image.height - box_height) / 2
+            return image.resize(size, reducing_gap=REDUCING_GAP,
+                                box=(left, top, left + box_width,
+                                     top + box_height))
+        image.thumbnail(size, reducing_gap=REDUCING_GAP)
+        if mode != "contain":
+            return image
+        return self.pad(image, size)
+
+    def pad(self, image, size):
+        if image.mode == "P":
+            image = image.convert("RGBA")
+        canvas = Image.new(image.mode, size,
+                           self.__args.get("background", "white"))
+        canvas.paste(image, ((size[0] - image.width) // 2,
+                             (size[1] - image.height) // 2))
+        return canvas
+
+    @staticmethod
+    def fitted(image_size, size):
+        """Largest size with image_size's aspect ratio inside size, never
+        larger than image_size itself."""
+        scale = min(size[0] / image_size[0], size[1] / image_size[1], 1)
+        return (max(1, round(image_size[0] * scale)),
+                max(1, round(image_size[1] * scale)))
+
+    def transform(self, image):
+        if "sizes" in self.__args:
+            raise ValueError("a multi-size ResizeImage has no single output")
+        return self.resize(image, self.target_size())
 
     def execute(self):
         image = Image.open(self.__filein)
-        resized_image = image.resize((self.__args['width'],
-                                      self.__args['height']))
-        resized_image.save(self.__fileout)
+        self.draft(image)
+        if "sizes" not in self.__args:
+            self.transform(image).save(
+                self.__fileout, **encode_options(self.__fileout, self.__args))
+            return
+        # One decode for the whole pyramid: every size is reduced from the
+        # smallest image already resampled that is at least as large on
+        # both axes, or from the source if there is none. cover always
+        # crops from the source
+        mode = self.__args.get("mode", "stretch")
+        resampled = []
+        for size in self.sizes():
+            if mode == "cover":
+                output = self.resize(image, size)
+            else:
+                needed = size if mode == "stretch" else \
+                    self.fitted(image.size, size)
+                bases = [base for base in resampled
+                         if base.width >= needed[0] and
+                         base.height >= needed[1]]
+                base = min(bases, default=image,
+                           key=lambda base: base.width * base.height)
+                output = base.resize(needed, reducing_gap=REDUCING_GAP)
+                resampled.append(output)
+                if mode == "contain":
+                    output = self.pad(output, size)
+            fileout = self.output(size)
+            output.save(fileout, **encode_options(fileout, self.__args))
+
+    def time_saved(self):
+        """Execute, then time one independent resize per size into a
+        temporary directory. Returns (seconds, independent seconds)."""
+        start = time.perf_counter()
+        self.execute()
+        seconds = time.perf_counter() - start
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            for width, height in self.sizes():
+                fileout = Path(directory) / f"{width}x{height}" \
+                    f"{self.__fileout.suffix}"
+                args = {key: value for key, value in self.__args.items()
+                        if key not in ("sizes", "template")}
+                args.update(width=width, height=height)
+                ResizeImage(self.__filein, fileout, args).execute()
+            independent = time.perf_counter() - start
+        return seconds, independent
 
 
 def main():
@@ -56,6 +208,12 @@ def main():
     resize_image = ResizeImage(filein, fileout, args)
     if resize_image.check():
         resize_image.execute()
+    args = {"sizes": [(1600, 1200), (800, 600), (400, 300), (160, 120)]}
+    resize_image = ResizeImage(filein, fileout, args)
+    if resize_image.check():
+        seconds, independent = resize_image.time_saved()
+        print(f"{len(args['sizes'])} sizes in {seconds:.3f}s, "
+              f"{independent - seconds:.3f}s saved over independent runs")
 
 
 if __name__ == "__main__":
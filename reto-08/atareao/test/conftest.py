@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# the actions live in src/ as plain modules, like the scripts import them
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,53 @@
+from PIL import Image, ImageChops, ImageStat
+
+from resize_image import ResizeImage
+from sample_image import sample_image
+
+SOURCE_SIZE = (3000, 2000)
+TARGET_SIZE = (200, 150)
+
+
+def _photo(path):
+    """The sample picture, saved as a large JPEG"""
+    sample_image(SOURCE_SIZE).save(path, quality=95)
+
+
+def test_draft_and_reduce_match_a_full_decode(tmp_path):
+    filein = tmp_path / "photo.jpg"
+    fileout = tmp_path / "thumb.png"
+    _photo(filein)
+    action = ResizeImage(
+        filein,
+        fileout,
+        {"width": TARGET_SIZE[0], "height": TARGET_SIZE[1]},
+    )
+
+    assert action.check()
+    action.execute()
+
+    # what execute() did before: full decode, plain resize
+    with Image.open(filein) as image:
+        expected = image.resize(TARGET_SIZE)
+    with Image.open(fileout) as result:
+        assert result.size == TARGET_SIZE
+        difference = ImageChops.difference(expected, result.convert("RGB"))
+    mean = sum(ImageStat.Stat(difference).mean) / 3
+    maximum = max(high for _, high in difference.getextrema())
+    assert mean < 1
+    assert maximum < 8
+
+
+def test_draft_decodes_at_reduced_scale(tmp_path):
+    filein = tmp_path / "photo.jpg"
+    _photo(filein)
+    action = ResizeImage(
+        filein,
+        tmp_path / "thumb.png",
+        {"width": TARGET_SIZE[0], "height": TARGET_SIZE[1]},
+    )
+
+    with Image.open(filein) as image:
+        action.draft(image)
+        image.load()
+        # 1/8 would drop below twice the target, 1/4 is the largest step
+        assert image.size == (750, 500)
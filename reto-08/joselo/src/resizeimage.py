@@ -50,10 +50,11 @@ class ResizeImage:
         if os.path.getsize(self.__filein) == 0:
             raise ValueError(f"El fichero {self.__filein} está vacio.")
 
-        im = Image(filename=self.__filein)
-        if not im.mimetype.startswith("image"):
-            raise ValueError(
-                f"El fichero {self.__filein} no parece una imágen.")
+        # Image.ping solo lee la cabecera, sin decodificar la imágen.
+        with Image.ping(filename=str(self.__filein)) as im:
+            if not im.mimetype.startswith("image"):
+                raise ValueError(
+                    f"El fichero {self.__filein} no parece una imágen.")
 
         if self.__fileout.is_file():
             raise FileExistsError(f"El fichero {self.__fileout} ya existe.")
@@ -66,9 +67,13 @@ class ResizeImage:
 
     def execute(self) -> None:
         """execute."""
-        im = Image(filename=self.__filein)
-        im.resize(self.__width, self.__height)
-        im.save(filename=self.__fileout)
+        with Image() as im:
+            # Pista para libjpeg: decodifica ya reducida (1/2, 1/4, 1/8)
+            # sin bajar del doble del tamaño pedido.
+            im.options["jpeg:size"] = f"{self.__width * 2}x{self.__height * 2}"
+            im.read(filename=str(self.__filein))
+            im.resize(self.__width, self.__height)
+            im.save(filename=str(self.__fileout))
 
     @property
     def size(self):
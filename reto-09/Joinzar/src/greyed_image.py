@@ -76,8 +76,13 @@ class Greyed_Image():
         cargándola en memoria, para poder actuar sobre ella.
         Crea una nueva imagen (memoria) haciendo grises la original y
         por último la guarda como imagen destino.
+        Si el original es un JPEG se decodifica directamente en grises.
         """
         with Image.open(self.filein) as image_origin:
+            if image_origin.format == "JPEG":
+                # libjpeg entrega directamente la luminancia (canal Y), sin
+                # reconstruir el color que luego se iba a descartar.
+                image_origin.draft("L", image_origin.size)
             image_origin.load()
         image_new = ImageOps.grayscale(image_origin)
         image_new.save(self.fileout)
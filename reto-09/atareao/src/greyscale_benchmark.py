@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+from collections import defaultdict
+import sys
+import tempfile
+import time
+from PIL import Image
+from greyscale_image import open_greyscale
+from sample_image import sample_image
+
+SAMPLE_SIZE = (2400, 1600)
+
+
+def sample_corpus(directory):
+    """Write the same synthetic picture as JPEG, RGB PNG, palette PNG and
+    BMP into directory."""
+    image = sample_image(SAMPLE_SIZE)
+    image.save(directory / "sample.jpg", quality=90)
+    image.save(directory / "sample.png")
+    image.quantize(256).save(directory / "sample_palette.png")
+    image.save(directory / "sample.bmp")
+    return sorted(directory.iterdir())
+
+
+def benchmark(files):
+    """Seconds spent per format by convert('L') after a full decode and by
+    open_greyscale(), as {format: [baseline, fast]}."""
+    times = defaultdict(lambda: [0.0, 0.0])
+    for filein in files:
+        try:
+            with Image.open(filein) as image:
+                format = image.format
+                if image.mode == "P":
+                    format = f"{format} (palette)"
+        except OSError:
+            continue
+        start = time.perf_counter()
+        with Image.open(filein) as image:
+            image.convert("L")
+        times[format][0] += time.perf_counter() - start
+        start = time.perf_counter()
+        open_greyscale(filein, keep_palette=True)
+        times[format][1] += time.perf_counter() - start
+    return times
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        if len(sys.argv) > 1:
+            files = [path for path in Path(sys.argv[1]).iterdir()
+                     if path.is_file()]
+        else:
+            files = sample_corpus(Path(directory))
+        print(f"{'format':16} {'convert ms':>11} {'fast ms':>9} {'gain':>6}")
+        for format, (baseline, fast) in benchmark(files).items():
+            print(f"{format:16} {baseline * 1000:11.1f} {fast * 1000:9.1f} "
+                  f"{baseline / fast:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
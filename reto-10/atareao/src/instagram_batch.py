@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fnmatch import fnmatch
+from pathlib import Path
+import mimetypes
+import os
+from instagram_image import InstagramImage
+
+
+def available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _initializer():
+    # Pay the PIL/pilgram import once per worker at start up instead of on
+    # the first image each one receives
+    import PIL.Image  # noqa: F401
+    import pilgram  # noqa: F401
+
+
+def _apply(filein, fileout, args):
+    try:
+        action = InstagramImage(filein, fileout, args)
+        if not action.check():
+            return filein, fileout, "check failed"
+        action.execute()
+        return filein, fileout, None
+    except Exception as exception:
+        return filein, fileout, f"{type(exception).__name__}: {exception}"
+
+
+class InstagramBatch:
+    """Apply one Instagram filter to every image of a directory.
+
+    Files are spread over a process pool and execute() yields
+    (filein, fileout, error) tuples as they finish; error is None on
+    success, so one broken image does not stop the rest.
+    """
+    def __init__(self, directory, out, filter_name, pattern="*",
+                 workers=None, profile=None):
+        self._directory = Path(directory)
+        self._out = Path(out)
+        self._args = {"filter": filter_name, "profile": profile}
+        self._pattern = pattern
+        self._workers = workers or available_cores()
+
+    @classmethod
+    def from_entry(cls, data, filter_name=None, workers=None):
+        """Build the batch from a `directorios` entry of the configuration,
+        taking the Instagram filter from its args if not given and the
+        encode profile from its "profile" key."""
+        if filter_name is None:
+            filter_name = data.get("args", {}).get("filter")
+        return cls(data["in"], data["out"], filter_name,
+                   data.get("filter", "*"), workers, data.get("profile"))
+
+    def files(self):
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.is_file() or \
+                        not fnmatch(entry.name, self._pattern):
+                    continue
+                mimetype = mimetypes.guess_type(entry.name)[0]
+                if mimetype and mimetype.startswith("image/"):
+                    yield Path(entry.path), self._out / entry.name
+
+    def execute(self):
+        with ProcessPoolExecutor(max_workers=self._workers,
+                                 initializer=_initializer) as executor:
+            futures = [executor.submit(_apply, filein, fileout, self._args)
+                       for filein, fileout in self.files()]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def main():
+    batch = InstagramBatch("/home/lorenzo/kk", "/home/lorenzo/kk/lofi",
+                           "lofi")
+    for filein, fileout, error in batch.execute():
+        if error:
+            print(f"{filein}: {error}")
+        else:
+            print(f"{filein} -> {fileout}")
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,8 @@
 
 from pathlib import Path
 from PIL import Image
-import pilgram
+import instagram_lut
+from encode_profiles import check_profile, encode_options
 
 FILTERS = [
     "_1977", "aden", "brannan", "brooklyn", "clarendon", "earlybird",
@@ -33,6 +34,10 @@ FILTERS = [
 
 
 class InstagramImage:
+    # Colour curves, blends and size-relative gradients: a Pipeline may
+    # move it across a resize
+    PER_PIXEL = True
+
     def __init__(self, filein, fileout, args={}):
         self._filein = filein
         self._fileout = fileout
@@ -47,13 +52,15 @@ class InstagramImage:
         if "filter" not in self._args.keys() or \
                 self._args['filter'] not in FILTERS:
             return False
-        return True
+        return check_profile(self._args)
+
+    def transform(self, image):
+        return instagram_lut.apply(image, self._args['filter'])
 
     def execute(self):
         image = Image.open(self._filein)
-        filter_name = self._args['filter']
-        filter = getattr(pilgram, filter_name)
-        filter(image).save(self._fileout)
+        self.transform(image).save(
+            self._fileout, **encode_options(self._fileout, self._args))
 
 
 def main():
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from importlib import metadata
+from pathlib import Path
+import os
+from PIL import Image, ImageChops, ImageFilter, ImageStat
+import pilgram
+
+# 33 points per channel is the usual size for .cube LUTs: the trilinear
+# interpolation between them stays within a couple of levels of the filter
+LUT_SIZE = 33
+# A uniform image that comes out with a wider spread than this went through
+# a vignette or gradient, so the filter depends on more than the colour
+SPATIAL_TOLERANCE = 2
+CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+CACHE_DIR = CACHE_HOME / "diogenes" / "luts"
+
+_luts = {}
+
+
+def _pilgram_version():
+    try:
+        return metadata.version("pilgram")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _identity(size):
+    # Color3DLUT tables run red fastest, then green, then blue: one row per
+    # (blue, green) pair and one column per red level
+    scale = 255 / (size - 1)
+    image = Image.new("RGB", (size, size * size))
+    image.putdata([(round(r * scale), round(g * scale), round(b * scale))
+                   for b in range(size)
+                   for g in range(size)
+                   for r in range(size)])
+    return image
+
+
+def is_spatial(filter_name):
+    filter = getattr(pilgram, filter_name)
+    for color in ((0, 0, 0), (128, 64, 200), (255, 255, 255)):
+        extrema = filter(Image.new("RGB", (64, 64), color)).getextrema()
+        if any(high - low > SPATIAL_TOLERANCE for low, high in extrema):
+            return True
+    return False
+
+
+def _cache_file(filter_name, size):
+    return CACHE_DIR / f"{filter_name}-{size}-{_pilgram_version()}.png"
+
+
+def bake(filter_name, size=LUT_SIZE):
+    """Sample a colour-only filter into a Color3DLUT, or None if spatial.
+
+    The sampled table is kept on disk as a lossless PNG, so the filter
+    only runs once per pilgram version.
+    """
+    if (filter_name, size) in _luts:
+        return _luts[(filter_name, size)]
+    cache_file = _cache_file(filter_name, size)
+    lut = None
+    if cache_file.exists():
+        table = Image.open(cache_file).convert("RGB")
+        lut = ImageFilter.Color3DLUT(size, [value / 255
+                                            for pixel in table.getdata()
+                                            for value in pixel])
+    elif not is_spatial(filter_name):
+        table = getattr(pilgram, filter_name)(_identity(size))
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Other processes of a batch may be looking for the same file: they
+        # must see either nothing or the whole table
+        temp = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+        table.save(temp, "PNG")
+        os.replace(temp, cache_file)
+        lut = ImageFilter.Color3DLUT(size, [value / 255
+                                            for pixel in table.getdata()
+                                            for value in pixel])
+    _luts[(filter_name, size)] = lut
+    return lut
+
+
+def apply(image, filter_name):
+    lut = bake(filter_name)
+    if lut is None:
+        return getattr(pilgram, filter_name)(image)
+    return image.convert("RGB").filter(lut)
+
+
+def report(image, filters):
+    """Compare the baked LUT with pilgram on image for every filter.
+
+    Returns (filter, method, mean error, max error) tuples, errors in
+    0-255 levels over all channels; spatial filters keep pilgram and
+    report no error.
+    """
+    image = image.convert("RGB")
+    rows = []
+    for filter_name in filters:
+        lut = bake(filter_name)
+        if lut is None:
+            rows.append((filter_name, "pilgram", 0.0, 0))
+            continue
+        expected = getattr(pilgram, filter_name)(image)
+        difference = ImageChops.difference(expected, image.filter(lut))
+        mean = sum(ImageStat.Stat(difference).mean) / 3
+        maximum = max(high for _, high in difference.getextrema())
+        rows.append((filter_name, "lut", mean, maximum))
+    return rows
+
+
+def main():
+    from instagram_image import FILTERS
+    image = Image.open("/home/lorenzo/kk/bb.jpg")
+    for filter_name, method, mean, maximum in report(image, FILTERS):
+        print(f"{filter_name:10} {method:8} mean {mean:6.3f} max {maximum}")
+
+
+if __name__ == "__main__":
+    main()
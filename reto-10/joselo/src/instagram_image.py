@@ -32,22 +32,32 @@ class InstagramImage:
     """InstagramImage."""
 
     def __init__(self, filein: Path, fileout: Path,
-                 args: dict[str, str]) -> None:
+                 args: dict[str, str], manifest=None) -> None:
 
         self.__filein = Path(filein)
         self.__fileout = Path(fileout)
         self.__filter = None
+        # Un manifest.Manifest (reto 11): con él solo se regeneran las
+        # salidas cuya entrada o filtro han cambiado.
+        self.__manifest = manifest
+        self.__args = {'filter': args.get('filter')}
         filtro = args['filter'] if 'filter' in args else None
         if hasattr(pilgram, filtro):
             self.__filter = getattr(pilgram, filtro)
 
+    def __outdated(self) -> bool:
+        if self.__manifest is None:
+            return not self.__fileout.exists()
+        return not self.__manifest.fresh(self.__filein, self.__fileout,
+                                         "InstagramImage", self.__args)
+
     def check(self) -> bool:
         """check."""
         return self.__filter is not None \
             and self.__filein.is_file() \
             and not self.__filein.is_symlink() \
             and self.__fileout.parent.is_dir() \
-            and not self.__fileout.exists()
+            and self.__outdated()
 
     def execute(self) -> None:
         """execute."""
@@ -55,6 +65,9 @@ class InstagramImage:
             image = Image.open(self.__filein)
             image = self.__filter(image)
             image.save(self.__fileout)
+            if self.__manifest is not None:
+                self.__manifest.record(self.__filein, self.__fileout,
+                                       "InstagramImage", self.__args)
         except Exception:
             pass
 
@@ -24,20 +24,79 @@
 from pathlib import Path
 import mimetypes
 from PIL import Image
+from pdf_writer import PdfWriter
+import fastcopy
+from encode_profiles import PROFILES, check_profile, encode_options
 
 
 ALLOWED_FROM = ["image/jpeg", "image/png", "image/bmp"]
 ALLOWED_TO = ["image/jpeg", "image/png", "image/bmp", "application/pdf"]
+WITHOUT_ALPHA = ["image/jpeg", "application/pdf"]
+# Pillow saves PDFs at 72 dpi when the image does not say otherwise
+DEFAULT_DPI = 72.0
 
 mimetypes.init()
 
 
+def pages(fileins, dpi=None):
+    """Yield (image, page size in points, lossy, source) for every input,
+    decoding one page at a time and downsampling it to dpi if the source is
+    denser. RGB and greyscale JPEGs that need no downsampling are not
+    decoded at all: source carries their bytes to embed in the PDF.
+    """
+    for filein in fileins:
+        with Image.open(filein) as image:
+            source_dpi = image.info.get("dpi", (DEFAULT_DPI,))[0] or \
+                DEFAULT_DPI
+            width, height = image.size
+            page_size = (width * 72 / source_dpi, height * 72 / source_dpi)
+            lossy = image.format == "JPEG"
+            downsample = dpi and dpi < source_dpi
+            if lossy and image.mode in ("RGB", "L") and not downsample:
+                yield image, page_size, lossy, Path(filein).read_bytes()
+                continue
+            if downsample:
+                size = (max(1, round(width * dpi / source_dpi)),
+                        max(1, round(height * dpi / source_dpi)))
+                image.draft(None, size)
+                page = image.resize(size, reducing_gap=2.0)
+            else:
+                image.load()
+                page = image
+            yield page, page_size, lossy, None
+
+
 class Convert:
     def __init__(self, filein, fileout, args={}):
         self._filein = filein
         self._fileout = fileout
+        self._args = args
+
+    def _inputs(self):
+        """Inputs of a multi-page PDF: a list of files or a directory."""
+        if isinstance(self._filein, (list, tuple)):
+            return [Path(filein) for filein in self._filein]
+        if self._filein.is_dir():
+            return sorted(filein for filein in self._filein.iterdir()
+                          if filein.is_file() and
+                          mimetypes.guess_type(filein)[0] in ALLOWED_FROM)
+        return None
+
+    def _check_many(self, fileins):
+        if not fileins or \
+                mimetypes.guess_type(self._fileout)[0] != "application/pdf":
+            return False
+        return all(filein.is_file() and
+                   mimetypes.guess_type(filein)[0] in ALLOWED_FROM
+                   for filein in fileins)
 
     def check(self):
+        fileins = self._inputs()
+        if not check_profile(self._args):
+            return False
+        if fileins is not None:
+            return self._fileout.parent.is_dir() and \
+                self._check_many(fileins)
         if not self._filein.exists() or not self._filein.is_file():
             return False
         if not self._fileout.parent.exists() or \
@@ -52,9 +111,39 @@ class Convert:
             return False
         return True
 
+    def transform(self, image):
+        mimetype_fileout = mimetypes.guess_type(self._fileout)[0]
+        if mimetype_fileout in WITHOUT_ALPHA and \
+                image.mode not in ("RGB", "L", "CMYK"):
+            return image.convert("RGB")
+        return image
+
     def execute(self):
+        fileins = self._inputs()
+        if fileins is None:
+            mimetype_filein = mimetypes.guess_type(self._filein)[0]
+            mimetype_fileout = mimetypes.guess_type(self._fileout)[0]
+            if mimetype_filein == mimetype_fileout:
+                # Nothing to transcode, maybe just another extension
+                # (.jpeg -> .jpg): copy the bytes untouched
+                if not self._fileout.exists() or \
+                        not self._fileout.samefile(self._filein):
+                    fastcopy.copy(self._filein, self._fileout)
+                return
+            if mimetype_filein == "image/jpeg" and \
+                    mimetype_fileout == "application/pdf":
+                fileins = [self._filein]
+        if fileins is not None:
+            quality = PROFILES.get(self._args.get("profile"), {}).get(
+                "JPEG", {}).get("quality")
+            with PdfWriter(self._fileout, quality) as writer:
+                for page, page_size, lossy, source in pages(
+                        fileins, self._args.get("dpi")):
+                    writer.add_page(page, page_size, lossy, source)
+            return
         image = Image.open(self._filein)
-        image.save(self._fileout)
+        self.transform(image).save(
+            self._fileout, **encode_options(self._fileout, self._args))
 
 
 def main():
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from io import BytesIO
+import sys
+import time
+from PIL import Image
+from encode_profiles import PROFILES
+from sample_image import sample_image
+
+ROUNDS = 5
+
+
+def benchmark(image, formats=("JPEG", "PNG")):
+    """Yield (profile, format, seconds per encode, bytes)."""
+    for profile, options in PROFILES.items():
+        for format in formats:
+            # Untimed first encode, so the first profile measured doesn't
+            # pay the encoder's one-time setup
+            image.save(BytesIO(), format, **options.get(format, {}))
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                buffer = BytesIO()
+                image.save(buffer, format, **options.get(format, {}))
+            seconds = (time.perf_counter() - start) / ROUNDS
+            yield profile, format, seconds, buffer.tell()
+
+
+def main():
+    if len(sys.argv) > 1:
+        image = Image.open(sys.argv[1]).convert("RGB")
+    else:
+        image = sample_image()
+    print(f"{'profile':10} {'format':6} {'ms':>8} {'bytes':>10}")
+    for profile, format, seconds, size in benchmark(image):
+        print(f"{profile:10} {format:6} {seconds * 1000:8.1f} {size:10}")
+
+
+if __name__ == "__main__":
+    main()
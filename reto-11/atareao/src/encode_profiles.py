@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from PIL import Image
+
+# Keyword arguments for Image.save() per profile and format. Without a
+# profile the actions keep Pillow's defaults (JPEG quality 75, PNG level 6)
+#
+# fast skips every extra pass: baseline JPEG with standard Huffman tables
+# and 4:2:0 chroma, PNG at zlib level 1. balanced pays one more JPEG pass
+# for optimized Huffman tables. small adds progressive scans and zlib level
+# 9. PNG's optimize is left out: it came out no smaller than level 9 alone
+# on smooth pictures and larger on noisy ones
+PROFILES = {
+    "fast": {
+        "JPEG": {"quality": 80, "subsampling": 2, "optimize": False,
+                 "progressive": False},
+        "PNG": {"compress_level": 1},
+    },
+    "balanced": {
+        "JPEG": {"quality": 85, "subsampling": 2, "optimize": True},
+        "PNG": {"compress_level": 6},
+    },
+    "small": {
+        "JPEG": {"quality": 75, "subsampling": 2, "optimize": True,
+                 "progressive": True},
+        "PNG": {"compress_level": 9},
+    },
+}
+
+
+def check_profile(args):
+    return args.get("profile") is None or args["profile"] in PROFILES
+
+
+def encode_options(fileout, args):
+    """Image.save() keyword arguments for fileout's format under the
+    profile named in args, if any."""
+    profile = args.get("profile")
+    if profile is None:
+        return {}
+    extension = fileout.suffix.lower()
+    format = Image.registered_extensions().get(extension)
+    return PROFILES[profile].get(format, {})
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import fcntl
+import shutil
+
+# ioctl request number of FICLONE (_IOW(0x94, 9, int)) on Linux
+FICLONE = 0x40049409
+
+
+def reflink(source, dest):
+    """Clone source into dest sharing extents (Btrfs, XFS...); raises
+    OSError where the filesystem cannot."""
+    with open(source, "rb") as fr, open(dest, "wb") as fw:
+        fcntl.ioctl(fw.fileno(), FICLONE, fr.fileno())
+
+
+def copy(source, dest):
+    """Copy without going through user space: a reflink if possible,
+    else shutil.copyfile, which uses sendfile on Linux."""
+    try:
+        reflink(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
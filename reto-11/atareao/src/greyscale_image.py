@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+from PIL import Image
+from encode_profiles import check_profile, encode_options
+
+# ITU-R 601-2 luma in 16 bit fixed point, exactly as convert('L') does it
+LUMA = (19595, 38470, 7471)
+# Formats that can store the greyed palette image as it is
+PALETTE_SUFFIXES = [".png", ".gif", ".bmp"]
+
+
+def open_greyscale(filein, keep_palette=False):
+    """Open filein already in greyscale, doing as little work as possible.
+
+    JPEGs are decoded straight to the Y channel by libjpeg, skipping chroma
+    upsampling and colour conversion. With keep_palette, palette images
+    only get their (at most 256 entry) palette turned grey and stay in P
+    mode. The rest goes through convert('L'), a single pass in C.
+    """
+    image = Image.open(filein)
+    if image.format == "JPEG":
+        image.draft("L", image.size)
+    if keep_palette and image.mode == "P" and \
+            "transparency" not in image.info:
+        palette = image.getpalette()
+        grey = []
+        for index in range(0, len(palette), 3):
+            red, green, blue = palette[index:index + 3]
+            value = (red * LUMA[0] + green * LUMA[1] + blue * LUMA[2] +
+                     0x8000) >> 16
+            grey += [value, value, value]
+        image.load()
+        image.putpalette(grey)
+        return image
+    if image.mode == "L":
+        image.load()
+        return image
+    return image.convert("L")
+
+
+class GreyscaleImage:
+    # Works pixel by pixel, so a Pipeline may move it across a resize
+    PER_PIXEL = True
+
+    def __init__(self, filein, fileout, args={}):
+        self.__filein = filein
+        self.__fileout = fileout
+        self.__args = args
+
+    def check(self):
+        if not self.__filein.exists() or not self.__filein.is_file():
+            return False
+        if not self.__fileout.parent.exists() or \
+                not self.__fileout.parent.is_dir():
+            return False
+        return check_profile(self.__args)
+
+    def transform(self, image):
+        if image.mode == 'L':
+            return image
+        return image.convert('L')
+
+    def execute(self):
+        keep_palette = self.__fileout.suffix.lower() in PALETTE_SUFFIXES
+        open_greyscale(self.__filein, keep_palette).save(
+            self.__fileout, **encode_options(self.__fileout, self.__args))
+
+
+def main():
+    filein = Path('/home/lorenzo/kk/bb.png')
+    fileout = Path('/home/lorenzo/kk/bb_grayscale.png')
+    action = GreyscaleImage(filein, fileout)
+    if action.check():
+        action.execute()
+
+
+if __name__ == "__main__":
+    main()
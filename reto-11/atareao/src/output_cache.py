@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from importlib import metadata
+from pathlib import Path
+import hashlib
+import os
+import shutil
+import sqlite3
+import time
+from fastcopy import reflink
+
+CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+CACHE_DIR = CACHE_HOME / "diogenes" / "outputs"
+MAX_SIZE = 1 << 30
+BUFFER = 1 << 20
+
+
+def _versions():
+    versions = []
+    for package in ("Pillow", "pilgram"):
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            pass
+    return ",".join(versions)
+
+
+def file_hash(path):
+    digest = hashlib.blake2b()
+    with open(path, "rb") as fr:
+        while chunk := fr.read(BUFFER):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def materialize(source, dest):
+    """Put a copy of source at dest: a reflink, else a plain copy.
+
+    Never a hardlink: the outputs belong to the user and a later in-place
+    write to one of them would silently rewrite the cache entry too.
+    """
+    temp = dest.with_name(f".{dest.name}.tmp")
+    try:
+        reflink(source, temp)
+    except OSError:
+        shutil.copyfile(source, temp)
+    os.replace(temp, dest)
+
+
+class OutputCache:
+    """Content addressed cache of the outputs of the image actions.
+
+    Entries are keyed by the source content, the action class, its args,
+    the output format and the Pillow/pilgram versions. The least recently
+    used ones are evicted once the cache grows over max_size bytes.
+    """
+    def __init__(self, directory=CACHE_DIR, max_size=MAX_SIZE):
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._versions = _versions()
+        self._connection = sqlite3.connect(self._directory / "cache.db")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+            "size INTEGER NOT NULL, used REAL NOT NULL)")
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self._connection.close()
+
+    def key(self, action_class, filein, fileout, args):
+        digest = hashlib.blake2b(file_hash(filein).encode())
+        digest.update(repr((action_class.__module__,
+                            action_class.__qualname__,
+                            sorted(args.items()),
+                            Path(fileout).suffix.lower(),
+                            self._versions)).encode())
+        return digest.hexdigest()
+
+    def _path(self, key, fileout):
+        return self._directory / key[:2] / f"{key}{Path(fileout).suffix}"
+
+    def run(self, action_class, filein, fileout, args={}):
+        """check() the action, then serve its output from the cache or
+        execute it and keep the result. Returns the check() result."""
+        action = action_class(filein, fileout, args)
+        # One entry per output: a multi-size resize writes several files
+        if "sizes" in args or not action.check():
+            return False
+        key = self.key(action_class, filein, fileout, args)
+        cached = self._path(key, fileout)
+        if cached.exists():
+            self.hits += 1
+            materialize(cached, Path(fileout))
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE entries SET used = ? WHERE key = ?",
+                    (time.time(), key))
+            return True
+        self.misses += 1
+        action.execute()
+        cached.parent.mkdir(exist_ok=True)
+        materialize(Path(fileout), cached)
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (key, cached.stat().st_size, time.time()))
+        self.evict()
+        return True
+
+    def evict(self):
+        total = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self._max_size:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM entries ORDER BY used").fetchall()
+        with self._connection:
+            for key, size in rows:
+                if total <= self._max_size:
+                    break
+                for path in (self._directory / key[:2]).glob(f"{key}*"):
+                    path.unlink()
+                self._connection.execute(
+                    "DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+
+
+def main():
+    from convert import Convert
+    cache = OutputCache()
+    filein = Path("/home/lorenzo/kk/bb.jpg")
+    fileout = Path("/home/lorenzo/kk/bb.pdf")
+    cache.run(Convert, filein, fileout)
+    print(f"hits: {cache.hits}, misses: {cache.misses}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2022 Lorenzo Carbonell <a.k.a. atareao>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from io import BytesIO
+import zlib
+
+JPEG_QUALITY = 90
+
+
+class PdfWriter:
+    """Write a PDF one page at a time.
+
+    Every page is encoded and written as soon as it is added, so only the
+    image being added has to be in memory. The page tree, whose object
+    number is reserved up front, and the xref go at the end.
+    """
+    def __init__(self, fileout, quality=None):
+        self._quality = quality or JPEG_QUALITY
+        self._file = open(fileout, "wb")
+        self._offsets = {}
+        self._kids = []
+        self._next = 3
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _reserve(self):
+        number = self._next
+        self._next += 1
+        return number
+
+    def _object(self, number, data, stream=None):
+        self._offsets[number] = self._file.tell()
+        self._file.write(f"{number} 0 obj\n".encode() + data)
+        if stream is not None:
+            self._file.write(b"\nstream\n" + stream + b"\nendstream")
+        self._file.write(b"\nendobj\n")
+
+    def _image(self, image, lossy):
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        colorspace = "/DeviceGray" if image.mode == "L" else "/DeviceRGB"
+        if lossy:
+            buffer = BytesIO()
+            image.save(buffer, "JPEG", quality=self._quality)
+            return colorspace, "/DCTDecode", buffer.getvalue()
+        return colorspace, "/FlateDecode", zlib.compress(image.tobytes())
+
+    def add_page(self, image, page_size, lossy=False, source=None):
+        """Add image as a new page of page_size points. Photos (lossy)
+        go in as JPEG, everything else losslessly deflated. source, the
+        bytes of a baseline/progressive RGB or L JPEG, is embedded as is
+        and image is then only used for its size and mode."""
+        page_width, page_height = page_size
+        if source is not None:
+            colorspace = "/DeviceGray" if image.mode == "L" else \
+                "/DeviceRGB"
+            filter, data = "/DCTDecode", source
+        else:
+            colorspace, filter, data = self._image(image, lossy)
+        width, height = image.size
+        image_number = self._reserve()
+        self._object(image_number, (
+            f"<< /Type /XObject /Subtype /Image /Width {width} "
+            f"/Height {height} /ColorSpace {colorspace} "
+            f"/BitsPerComponent 8 /Filter {filter} /Length {len(data)} >>"
+        ).encode(), data)
+        contents = (f"q {page_width:.4f} 0 0 {page_height:.4f} 0 0 cm "
+                    f"/Im0 Do Q").encode()
+        contents_number = self._reserve()
+        self._object(contents_number,
+                     f"<< /Length {len(contents)} >>".encode(), contents)
+        page_number = self._reserve()
+        self._object(page_number, (
+            f"<< /Type /Page /Parent 2 0 R "
+            f"/MediaBox [0 0 {page_width:.4f} {page_height:.4f}] "
+            f"/Resources << /XObject << /Im0 {image_number} 0 R >> >> "
+            f"/Contents {contents_number} 0 R >>").encode())
+        self._kids.append(page_number)
+
+    def close(self):
+        if self._file.closed:
+            return
+        kids = " ".join(f"{number} 0 R" for number in self._kids)
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] "
+                        f"/Count {len(self._kids)} >>".encode())
+        xref = self._file.tell()
+        size = self._next
+        self._file.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode())
+        for number in range(1, size):
+            self._file.write(f"{self._offsets[number]:010d} 00000 n \n"
+                             .encode())
+        self._file.write(f"trailer\n<< /Size {size} /Root 1 0 R >>\n"
+                         f"startxref\n{xref}\n%%EOF\n".encode())
+        self._file.close()
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageChops
+
+import instagram_lut
+from greyscale_image import GreyscaleImage
+from instagram_image import InstagramImage
+from pipeline import Pipeline, reorder
+from resize_image import ResizeImage
+from sample_image import sample_image
+
+FIT = {"width": 200, "height": 150, "mode": "fit"}
+CONTAIN = {"width": 200, "height": 200, "mode": "contain"}
+
+
+@pytest.fixture(autouse=True)
+def lut_cache(tmp_path, monkeypatch):
+    # keep the baked tables out of the user's cache
+    monkeypatch.setattr(instagram_lut, "CACHE_DIR", tmp_path / "luts")
+
+
+@pytest.fixture
+def photo(tmp_path):
+    filein = tmp_path / "photo.png"
+    sample_image().save(filein)
+    return filein
+
+
+def _actions(*stages):
+    path = Path("unused.png")
+    return [action(path, path, args) for action, args in stages]
+
+
+def test_pipeline_matches_the_stages_one_by_one(tmp_path, photo):
+    stages = [(ResizeImage, FIT),
+              (InstagramImage, {"filter": "lofi"}),
+              (GreyscaleImage, {})]
+    fileout = tmp_path / "pipeline.png"
+    action = Pipeline(photo, fileout, stages)
+
+    assert action.check()
+    action.execute()
+
+    filein = photo
+    for index, (stage, args) in enumerate(stages):
+        step = tmp_path / f"step{index}.png"
+        stage(filein, step, args).execute()
+        filein = step
+    with Image.open(fileout) as result, Image.open(filein) as expected:
+        assert result.mode == expected.mode == "L"
+        assert result.size == expected.size == (200, 150)
+        assert ImageChops.difference(result, expected).getbbox() is None
+
+
+def test_reorder_moves_resizes_ahead_of_colour_stages():
+    instagram, greyscale, resize = _actions(
+        (InstagramImage, {"filter": "lofi"}),
+        (GreyscaleImage, {}),
+        (ResizeImage, FIT))
+
+    assert reorder([instagram, greyscale, resize], (1600, 1200)) == \
+        [resize, instagram, greyscale]
+
+
+def test_reorder_keeps_an_upscale_after_colour_stages():
+    greyscale, resize = _actions((GreyscaleImage, {}), (ResizeImage, FIT))
+
+    assert reorder([greyscale, resize], (100, 75)) == [greyscale, resize]
+
+
+def test_reorder_never_moves_anything_across_a_contain():
+    greyscale, contain, resize = _actions(
+        (GreyscaleImage, {}),
+        (ResizeImage, CONTAIN),
+        (ResizeImage, FIT))
+
+    assert reorder([greyscale, contain], (1600, 1200)) == \
+        [greyscale, contain]
+    assert reorder([contain, greyscale, resize], (1600, 1200)) == \
+        [contain, resize, greyscale]
+    assert reorder([greyscale, contain, resize], (1600, 1200)) == \
+        [greyscale, contain, resize]
+
+
+def test_reordered_pipeline_resizes_first(tmp_path, photo):
+    stages = [(GreyscaleImage, {}), (ResizeImage, FIT)]
+    fileout = tmp_path / "reordered.png"
+    action = Pipeline(photo, fileout, stages, {"allow_reorder": True})
+
+    assert action.check()
+    action.execute()
+
+    # greyscale is linear, so resizing first only adds rounding noise:
+    # both orders round twice, a level apart at most each time
+    filein = photo
+    for index, (stage, args) in enumerate(stages):
+        step = tmp_path / f"step{index}.png"
+        stage(filein, step, args).execute()
+        filein = step
+    with Image.open(fileout) as result, Image.open(filein) as expected:
+        assert result.size == expected.size == (200, 150)
+        difference = ImageChops.difference(result, expected)
+        assert max(difference.getextrema()) <= 2
@@ -26,17 +26,18 @@
 
 from pathlib import Path
 from PIL import Image
-import magic
+from mime_cache import MimeCache
 
 
 class Convert():
     '''
     convert class
     '''
-    def __init__(self, dir_path, in_file, out_file):
+    def __init__(self, dir_path, in_file, out_file, mime_cache=None):
         '''
         init method
         '''
+        self.mime_cache = mime_cache
         self.dir_path = dir_path
         self.in_file = in_file
         self.out_file = out_file
@@ -62,7 +63,13 @@ class Convert():
         if Path(f"{self.dir_path}/{self.in_file}"):
             in_file_path = Path(f"{self.dir_path}/{self.in_file}")
             print(f"Fichero base: {in_file_path}")
-            self.in_file_type = magic.from_file(f"{in_file_path}", mime=True)
+            # SE USA LA CACHÉ COMPARTIDA; SI NO HAY, UNA SOLO PARA ESTE CHECK
+            if self.mime_cache:
+                self.in_file_type = self.mime_cache.mime_type(in_file_path)
+            else:
+                mime_cache = MimeCache()
+                self.in_file_type = mime_cache.mime_type(in_file_path)
+                mime_cache.close()
             print(f"Tipo fichero base: {self.in_file_type}")
         else:
             print("El fichero {self.in_file} no existe.")
@@ -26,6 +26,7 @@
 
 
 from convert import Convert
+from mime_cache import MimeCache
 
 
 def main():
@@ -35,9 +36,11 @@ def main():
     dir_path = "/home/andy/Downloads"
     in_file = "file.jpg"
     out_file = "file.pdf"
-    conv_obj = Convert(dir_path, in_file, out_file)
+    mime_cache = MimeCache()
+    conv_obj = Convert(dir_path, in_file, out_file, mime_cache)
     if conv_obj.check():
         conv_obj.execute()
+    mime_cache.close()
 
 
 if __name__ == "__main__":
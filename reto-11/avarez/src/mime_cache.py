@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# -*- coding: utf-8 -*-
+
+# Author: Andrés Pérez <a.k.a. avarez>
+# Copyright (c)
+# Created: 18 October 2026
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+import magic
+
+SNIFF_SIZE = 8192
+MAX_ENTRIES = 100000
+EXTENSIONS = {".jpeg": "image/jpeg",
+              ".jpg": "image/jpeg",
+              ".png": "image/png",
+              ".bmp": "image/bmp",
+              ".gif": "image/gif",
+              ".svg": "image/svg+xml",
+              ".pdf": "application/pdf",
+              ".txt": "text/plain"}
+
+
+def default_db_path():
+    '''
+    RUTA DE LA CACHÉ DENTRO DE XDG_CACHE_HOME
+    '''
+    cache_home = os.environ.get("XDG_CACHE_HOME",
+                                Path.home() / ".cache")
+    return Path(cache_home) / "diogenes" / "mime.db"
+
+
+class MimeCache():
+    '''
+    mime cache class
+    '''
+    def __init__(self, db_path=None, max_entries=MAX_ENTRIES):
+        '''
+        init method
+        '''
+        self.db_path = Path(db_path) if db_path else default_db_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS mime ("
+                          "dev INTEGER, ino INTEGER, size INTEGER, "
+                          "mtime_ns INTEGER, mime TEXT, used INTEGER, "
+                          "PRIMARY KEY (dev, ino))")
+        self.entries = self.conn.execute("SELECT COUNT(*) FROM "
+                                         "mime").fetchone()[0]
+
+    def mime_type(self, file_path):
+        '''
+        mime type method
+        '''
+        # PRIMERO LA TABLA DE EXTENSIONES, SIN TOCAR EL DISCO
+        file_path = Path(file_path)
+        mime = EXTENSIONS.get(file_path.suffix.lower())
+        if mime:
+            return mime
+        # DESPUÉS LA CACHÉ, CLAVE (DEV, INODE, SIZE, MTIME_NS)
+        stat = file_path.stat()
+        row = self.conn.execute("SELECT size, mtime_ns, mime FROM mime "
+                                "WHERE dev = ? AND ino = ?",
+                                (stat.st_dev, stat.st_ino)).fetchone()
+        if row and row[:2] == (stat.st_size, stat.st_mtime_ns):
+            self.conn.execute("UPDATE mime SET used = ? WHERE dev = ? AND "
+                              "ino = ?", (time.time_ns(), stat.st_dev,
+                                          stat.st_ino))
+            return row[2]
+        # Y SOLO SI FALLA, LIBMAGIC CON LOS PRIMEROS KIB DEL FICHERO
+        with open(file_path, "rb") as file_pipe:
+            mime = magic.from_buffer(file_pipe.read(SNIFF_SIZE), mime=True)
+        self.conn.execute("INSERT OR REPLACE INTO mime VALUES "
+                          "(?, ?, ?, ?, ?, ?)",
+                          (stat.st_dev, stat.st_ino, stat.st_size,
+                           stat.st_mtime_ns, mime, time.time_ns()))
+        # UNA ENTRADA CADUCADA SE REEMPLAZA, NO SUMA
+        if not row:
+            self.entries += 1
+        return mime
+
+    def evict(self):
+        '''
+        evict method
+        '''
+        # SOLO SE ORDENA LA TABLA SI SE HA PASADO DEL LÍMITE
+        if self.entries <= self.max_entries:
+            return
+        # SE BORRAN LAS ENTRADAS USADAS HACE MÁS TIEMPO (LRU)
+        self.conn.execute("DELETE FROM mime WHERE rowid IN (SELECT rowid "
+                          "FROM mime ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                          (self.max_entries,))
+        self.entries = self.max_entries
+
+    def close(self):
+        '''
+        close method
+        '''
+        self.evict()
+        self.conn.commit()
+        self.conn.close()
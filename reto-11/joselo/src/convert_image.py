@@ -24,15 +24,26 @@
 # SOFTWARE.
 
 from pathlib import Path
+from typing import Optional
 from PIL import Image
+from manifest import Manifest
 
 
 class Convert:
     """Convert."""
 
-    def __init__(self, filein: Path, fileout: Path) -> None:
+    def __init__(self, filein: Path, fileout: Path,
+                 manifest: Optional[Manifest] = None) -> None:
         self.__filein = Path(filein)
         self.__fileout = Path(fileout)
+        self.__manifest = manifest
+
+    def __outdated(self) -> bool:
+        # Sin manifiesto nunca se sobrescribe una salida existente.
+        if self.__manifest is None:
+            return not self.__fileout.exists()
+        return not self.__manifest.fresh(self.__filein, self.__fileout,
+                                         "Convert")
 
     def check(self) -> bool:
         """check."""
@@ -40,7 +51,7 @@ class Convert:
             and not self.__filein.is_symlink() \
             and self.__filein.suffix in ('.jpg', '.png', '.bmp') \
             and self.__fileout.parent.is_dir() \
-            and not self.__fileout.exists() \
+            and self.__outdated() \
             and self.__fileout.suffix in ('.jpg', '.png', '.bmp', '.pdf')
 
     def execute(self) -> None:
@@ -49,14 +60,17 @@ class Convert:
             if self.__filein.suffix == '.png':
                 image = image.convert('RGB')
             image.save(self.__fileout)
+        if self.__manifest is not None:
+            self.__manifest.record(self.__filein, self.__fileout, "Convert")
 
 
 def main():  # noqa
     filein = Path("/home/lorenzo/kk/bb.jpg")
     fileout = Path("/home/lorenzo/kk/bb.pdf")
-    action = Convert(filein, fileout)
-    if action.check():
-        action.execute()
+    with Manifest(fileout.parent) as manifest:
+        action = Convert(filein, fileout, manifest)
+        if action.check():
+            action.execute()
 
 
 if __name__ == '__main__':
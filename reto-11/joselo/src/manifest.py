@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Reto 11: manifiesto de salidas al estilo make."""
+
+# Copyright (c) 2022 José Lorenzo Nieto Corral <a.k.a. jlnc> <a.k.a. JoseLo>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+MANIFEST = ".diogenes-manifest.json"
+BUFFER = 1 << 20
+
+
+def file_hash(path: Path) -> str:
+    """file_hash."""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as fr:
+        while chunk := fr.read(BUFFER):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """Manifest.
+
+    Guarda, para cada fichero de salida, de qué fichero y con qué acción y
+    argumentos se generó, junto con el tamaño y la fecha de modificación de
+    ambos. Una salida solo está al día si nada de eso ha cambiado;
+    comprobarlo cuesta un stat de la entrada y otro de la salida, y solo se
+    calcula el hash de la entrada cuando su stat no coincide.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.__path = Path(path)
+        if self.__path.is_dir():
+            self.__path = self.__path / MANIFEST
+        self.__entries: dict[str, dict[str, Any]] = {}
+        if self.__path.is_file():
+            with open(self.__path, encoding="utf-8") as fr:
+                self.__entries = json.load(fr)
+        self.__dirty = False
+
+    def __enter__(self) -> "Manifest":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.save()
+
+    @staticmethod
+    def __params(action: str, args: Optional[dict]) -> str:
+        return json.dumps([action, args or {}], sort_keys=True, default=str)
+
+    def fresh(self, filein: Path, fileout: Path, action: str,
+              args: Optional[dict] = None) -> bool:
+        """Indica si fileout ya está generada a partir de filein."""
+        entry = self.__entries.get(str(Path(fileout).resolve()))
+        if entry is None \
+                or entry["source"] != str(Path(filein).resolve()) \
+                or entry["params"] != self.__params(action, args):
+            return False
+        try:
+            stin = os.stat(filein)
+            stout = os.stat(fileout)
+        except FileNotFoundError:
+            return False
+        if (stout.st_size, stout.st_mtime_ns) != \
+                (entry["out_size"], entry["out_mtime_ns"]):
+            return False
+        if (stin.st_size, stin.st_mtime_ns) == \
+                (entry["size"], entry["mtime_ns"]):
+            return True
+        # Misma entrada con otra fecha (copiada, restaurada, touch...).
+        if stin.st_size != entry["size"] or file_hash(filein) != entry["hash"]:
+            return False
+        entry["mtime_ns"] = stin.st_mtime_ns
+        self.__dirty = True
+        return True
+
+    def record(self, filein: Path, fileout: Path, action: str,
+               args: Optional[dict] = None) -> None:
+        """Anota que fileout se acaba de generar a partir de filein."""
+        stin = os.stat(filein)
+        stout = os.stat(fileout)
+        self.__entries[str(Path(fileout).resolve())] = {
+            "source": str(Path(filein).resolve()),
+            "params": self.__params(action, args),
+            "size": stin.st_size,
+            "mtime_ns": stin.st_mtime_ns,
+            "hash": file_hash(filein),
+            "out_size": stout.st_size,
+            "out_mtime_ns": stout.st_mtime_ns,
+        }
+        self.__dirty = True
+
+    def save(self) -> None:
+        """save."""
+        if not self.__dirty:
+            return
+        temp = self.__path.with_name(f".{self.__path.name}.tmp")
+        with open(temp, "w", encoding="utf-8") as fw:
+            json.dump(self.__entries, fw)
+        os.replace(temp, self.__path)
+        self.__dirty = False
@@ -24,29 +24,44 @@
 # SOFTWARE.
 
 
+import fastcopy
 from pathlib import Path
-import shutil
-from typing import Union
+from typing import Optional, Union
 
 
 class Copy:
-    """Copy."""
+    """Copy.
+
+    El argumento 'link' se corresponde con la clave 'link' de una entrada
+    de 'directorios' ("copy", "reflink", "hard" o "sym"). Para directorios
+    'out' de archivo, de solo lectura, un enlace evita duplicar los datos;
+    si no es posible (distinto sistema de ficheros), se copia.
+    """
 
     def __init__(self, filein: Union[Path, str],
-                   fileout: Union[Path, str]) -> None:
+                 fileout: Union[Path, str], link: str = "copy") -> None:
         self.__filein = Path(filein)
         self.__fileout = Path(fileout)
+        self.__link = link
+        self.__strategy: Optional[str] = None
 
     def check(self) -> bool:
         """check."""
         return self.__filein.is_file() \
             and not self.__filein.is_symlink() \
             and self.__fileout.parent.is_dir() \
-            and (self.__fileout.is_dir() or not self.__fileout.exists())
+            and (self.__fileout.is_dir() or not self.__fileout.exists()) \
+            and self.__link in fastcopy.LINKS
 
     def execute(self) -> None:
         """execute."""
-        shutil.copy(self.__filein, self.__fileout, follow_symlinks=False)
+        self.__strategy = fastcopy.materialize(
+            self.__filein, self.__fileout, self.__link)
+
+    @property
+    def strategy(self) -> Optional[str]:
+        """El modo o la estrategia de copia usada por execute."""
+        return self.__strategy
 
 
 def main():  # noqa
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Reto 12: motor de copia sin pasar por espacio de usuario."""
+
+# Copyright (c) 2022 José Lorenzo Nieto Corral <a.k.a. jlnc> <a.k.a. JoseLo>
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import errno
+import fcntl
+import os
+from pathlib import Path
+import shutil
+from typing import Callable, Union
+
+# Número de la petición ioctl FICLONE (_IOW(0x94, 9, int)) en Linux.
+FICLONE = 0x40049409
+
+CHUNK = 1 << 30
+BUFFER = 1 << 20
+
+# Errores que indican que la estrategia no vale en este sistema de ficheros,
+# no que la copia haya fallado.
+NO_SOPORTADO = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ETXTBSY}
+
+
+def reflink(fd_in: int, fd_out: int, size: int) -> None:
+    """Clonar el fichero (btrfs, XFS): solo se copian metadatos."""
+    fcntl.ioctl(fd_out, FICLONE, fd_in)
+
+
+def _sin_progreso(copied: int, size: int) -> None:
+    """Una copia en el kernel devolvió 0 antes de terminar.
+
+    Algunos sistemas de ficheros y pseudo ficheros lo hacen en lugar de dar
+    un error. Si aún no se ha escrito nada se pasa a la siguiente
+    estrategia; si no, el destino está truncado y es un error.
+    """
+    if copied == 0:
+        raise OSError(errno.EINVAL, "La copia en el kernel no avanza")
+    raise OSError(errno.EIO, f"Copia incompleta: {copied} de {size} bytes")
+
+
+def copy_file_range(fd_in: int, fd_out: int, size: int) -> None:
+    """Copiar dentro del kernel con copy_file_range(2)."""
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(fd_in, fd_out, min(size - copied, CHUNK))
+        if count == 0:
+            _sin_progreso(copied, size)
+        copied += count
+
+
+def sendfile(fd_in: int, fd_out: int, size: int) -> None:
+    """Copiar dentro del kernel con sendfile(2)."""
+    copied = 0
+    while copied < size:
+        count = os.sendfile(fd_out, fd_in, copied, min(size - copied, CHUNK))
+        if count == 0:
+            _sin_progreso(copied, size)
+        copied += count
+
+
+# Las estrategias, de la más rápida a la más lenta. Se pueden añadir o
+# quitar estrategias modificando la lista.
+strategies: list[tuple[str, Callable[[int, int, int], None]]] = [
+    ("reflink", reflink)]
+if hasattr(os, "copy_file_range"):
+    strategies.append(("copy_file_range", copy_file_range))
+if hasattr(os, "sendfile"):
+    strategies.append(("sendfile", sendfile))
+
+
+def copy_file(filein: Union[Path, str], fileout: Union[Path, str]) -> str:
+    """Copiar el contenido de un fichero con la estrategia más rápida.
+
+    Se prueban las estrategias en orden y se usa la primera que admita el
+    sistema de ficheros. La copia con buffer en espacio de usuario es el
+    último recurso.
+
+    Parameters
+    ----------
+    filein : Union[Path, str]
+        El fichero origen.
+    fileout : Union[Path, str]
+        El fichero destino.
+
+    Returns
+    -------
+    str
+        El nombre de la estrategia usada.
+
+    """
+    with open(filein, 'rb') as fr, open(fileout, 'wb') as fw:
+        size = os.fstat(fr.fileno()).st_size
+        # Ficheros vacíos, o pseudo ficheros que dicen tener tamaño 0.
+        if size > 0:
+            for name, strategy in strategies:
+                try:
+                    strategy(fr.fileno(), fw.fileno(), size)
+                    return name
+                except OSError as error:
+                    if error.errno not in NO_SOPORTADO:
+                        raise
+                    fr.seek(0)
+                    fw.seek(0)
+                    fw.truncate()
+        shutil.copyfileobj(fr, fw, BUFFER)
+        return "buffered"
+
+
+def copy(filein: Union[Path, str], fileout: Union[Path, str]) -> str:
+    """Como shutil.copy (contenido y permisos), pero usando copy_file.
+
+    Parameters
+    ----------
+    filein : Union[Path, str]
+        El fichero origen.
+    fileout : Union[Path, str]
+        El fichero o directorio destino.
+
+    Returns
+    -------
+    str
+        El nombre de la estrategia usada.
+
+    """
+    fileout = Path(fileout)
+    if fileout.is_dir():
+        fileout = fileout / Path(filein).name
+    strategy = copy_file(filein, fileout)
+    shutil.copymode(filein, fileout)
+    return strategy
+
+
+# Modos de materializar la copia, clave 'link' de cada entrada de
+# 'directorios'.
+LINKS = ("copy", "reflink", "hard", "sym")
+
+
+def materialize(filein: Union[Path, str], fileout: Union[Path, str],
+                link: str = "copy") -> str:
+    """Crear fileout a partir de filein según el modo 'link'.
+
+    - "hard": un enlace duro; no ocupa espacio ni se copia nada.
+    - "sym": un enlace simbólico a la ruta absoluta de filein.
+    - "reflink": un clon (btrfs, XFS) que comparte bloques con filein.
+    - "copy": una copia con la estrategia más rápida disponible.
+
+    Si el modo no es posible (p.e. un enlace duro entre dos sistemas de
+    ficheros distintos, o un reflink en ext4), se recurre al siguiente
+    modo más barato hasta acabar en "copy".
+
+    Parameters
+    ----------
+    filein : Union[Path, str]
+        El fichero origen.
+    fileout : Union[Path, str]
+        El fichero o directorio destino.
+    link : str
+        Uno de LINKS.
+
+    Returns
+    -------
+    str
+        El modo, o la estrategia de copia, que se ha usado al final.
+
+    """
+    if link not in LINKS:
+        raise ValueError(f"Modo de enlace desconocido: {link}")
+    filein = Path(filein)
+    fileout = Path(fileout)
+    if fileout.is_dir():
+        fileout = fileout / filein.name
+    try:
+        if link == "hard":
+            os.link(filein, fileout)
+            return "hard"
+        if link == "sym":
+            os.symlink(filein.absolute(), fileout)
+            return "sym"
+    except OSError as error:
+        if error.errno not in NO_SOPORTADO | {errno.EPERM, errno.EMLINK}:
+            raise
+    if link in ("hard", "reflink"):
+        with open(filein, 'rb') as fr, open(fileout, 'wb') as fw:
+            try:
+                reflink(fr.fileno(), fw.fileno(), 0)
+                cloned = True
+            except OSError as error:
+                if error.errno not in NO_SOPORTADO:
+                    raise
+                cloned = False
+        if cloned:
+            shutil.copymode(filein, fileout)
+            return "reflink"
+    return copy(filein, fileout)
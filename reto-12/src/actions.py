@@ -1,6 +1,7 @@
-import shutil
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+
+import fastcopy
 
 
 class Copy:
@@ -9,6 +10,7 @@ class Copy:
     def __init__(self, file_in: Union[str, Path], file_out: Union[str, Path]):
         self.file_in = Path(file_in)
         self.file_out = Path(file_out)
+        self.strategy: Optional[str] = None
 
     def check(self) -> bool:
         """
@@ -33,7 +35,7 @@ class Copy:
             if not self.file_out.parent:
                 self.file_out.parent.mkdir(parents=True)
 
-            shutil.copy2(self.file_in, self.file_out)
+            self.strategy = fastcopy.copy2(self.file_in, self.file_out)
 
 
 class Remove:
@@ -0,0 +1,110 @@
+import errno
+import fcntl
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, List, Tuple, Union
+
+# Número de la petición ioctl FICLONE (_IOW(0x94, 9, int)) en Linux
+FICLONE = 0x40049409
+
+CHUNK = 1 << 30
+BUFFER = 1 << 20
+
+# Errores que indican que la estrategia no vale en este sistema de ficheros,
+# no que la copia haya fallado
+NOT_SUPPORTED = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.ETXTBSY,
+}
+
+
+def reflink(fd_in: int, fd_out: int, size: int) -> None:
+    """Clona el fichero (btrfs, XFS): solo se copian metadatos"""
+    fcntl.ioctl(fd_out, FICLONE, fd_in)
+
+
+def _stalled(copied: int, size: int) -> None:
+    """
+    La copia en el kernel devolvió 0 antes de terminar. Si aún no se ha
+    escrito nada se pasa a la siguiente estrategia; si no, el destino está
+    truncado y es un error.
+    """
+    if copied == 0:
+        raise OSError(errno.EINVAL, "La copia en el kernel no avanza")
+    raise OSError(errno.EIO, f"Copia incompleta: {copied} de {size} bytes")
+
+
+def copy_file_range(fd_in: int, fd_out: int, size: int) -> None:
+    """Copia dentro del kernel con copy_file_range(2)"""
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(fd_in, fd_out, min(size - copied, CHUNK))
+        if count == 0:
+            _stalled(copied, size)
+        copied += count
+
+
+def sendfile(fd_in: int, fd_out: int, size: int) -> None:
+    """Copia dentro del kernel con sendfile(2)"""
+    copied = 0
+    while copied < size:
+        count = os.sendfile(fd_out, fd_in, copied, min(size - copied, CHUNK))
+        if count == 0:
+            _stalled(copied, size)
+        copied += count
+
+
+# Las estrategias, de la más rápida a la más lenta
+strategies: List[Tuple[str, Callable[[int, int, int], None]]] = [
+    ("reflink", reflink)
+]
+if hasattr(os, "copy_file_range"):
+    strategies.append(("copy_file_range", copy_file_range))
+if hasattr(os, "sendfile"):
+    strategies.append(("sendfile", sendfile))
+
+
+def copy_file(file_in: Union[str, Path], file_out: Union[str, Path]) -> str:
+    """
+    Copia el contenido de file_in en file_out con la primera estrategia que
+    admita el sistema de ficheros. La copia con buffer es el último recurso.
+
+    Returns:
+        str: el nombre de la estrategia usada
+    """
+    with open(file_in, "rb") as fr, open(file_out, "wb") as fw:
+        size = os.fstat(fr.fileno()).st_size
+        if size > 0:
+            for name, strategy in strategies:
+                try:
+                    strategy(fr.fileno(), fw.fileno(), size)
+                    return name
+                except OSError as error:
+                    if error.errno not in NOT_SUPPORTED:
+                        raise
+                    fr.seek(0)
+                    fw.seek(0)
+                    fw.truncate()
+        shutil.copyfileobj(fr, fw, BUFFER)
+        return "buffered"
+
+
+def copy2(file_in: Union[str, Path], file_out: Union[str, Path]) -> str:
+    """
+    Como shutil.copy2 (contenido, permisos y fechas), pero usando copy_file
+
+    Returns:
+        str: el nombre de la estrategia usada
+    """
+    file_out = Path(file_out)
+    if file_out.is_dir():
+        file_out = file_out / Path(file_in).name
+    strategy = copy_file(file_in, file_out)
+    shutil.copystat(file_in, file_out)
+    return strategy